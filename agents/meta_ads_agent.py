@@ -5,9 +5,10 @@ Enhanced with multi-step planning and autonomous operation chaining
 """
 import os
 import logging
-import json
 import inspect
+from functools import lru_cache
 from typing import Dict, Any, List, TypedDict, Annotated, Literal
+import orjson
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 from langchain_openai import ChatOpenAI
@@ -31,6 +32,100 @@ class AgentState(TypedDict):
     sdk_plan: Dict[str, Any]  # Add this field to fix the error
 
 
+# Operation type of each known SDK method; unknown names fall back to name patterns
+_METHOD_PATTERNS = {
+    "get_all_campaigns": "QUERY",
+    "get_campaigns_by_status": "QUERY",
+    "get_campaign_insights": "QUERY",
+    "get_performance_metrics": "QUERY",
+    "search_campaigns": "QUERY",
+    "search_adsets": "QUERY",
+    "get_adsets_for_campaign": "QUERY",
+    "get_ads_for_adset": "QUERY",
+    "get_adset_insights": "QUERY",
+    "get_insights_bulk": "QUERY",
+    "query": "QUERY",
+    "update_adset_budget": "UPDATE",
+    "update_campaign_budget": "UPDATE",
+    "pause_adset": "UPDATE",
+    "resume_adset": "UPDATE",
+    "pause_campaign": "UPDATE",
+    "resume_campaign": "UPDATE",
+    "bulk_update_adsets": "UPDATE",
+    "bulk_pause_adsets": "UPDATE",
+}
+
+
+def _result_shape(result: Any) -> Any:
+    """Reduce a step result to the parts pattern recognition looks at"""
+    if isinstance(result, dict):
+        return ("dict", "success" in result or "updated" in result, "error" in result)
+    if isinstance(result, list):
+        return "list"
+    return type(result).__name__
+
+
+@lru_cache(maxsize=256)
+def _classify_operation_pattern(last_method: str, results_shape: tuple) -> str:
+    """Pattern recognition over a hashable (last sdk_method, result shapes) key"""
+    if last_method is not None:
+        pattern = _METHOD_PATTERNS.get(last_method)
+        if pattern:
+            return pattern
+        
+        # Look for patterns in operation names - use word boundaries
+        # Check for common prefixes/patterns in Meta SDK method names
+        update_patterns = ["update_", "set_", "modify_", "change_", "edit_"]
+        query_patterns = ["get_", "search_", "fetch_", "list_", "retrieve_", "_insights", "_metrics"]
+        
+        # Check for QUERY patterns FIRST (more specific)
+        if any(pattern in last_method for pattern in query_patterns):
+            return "QUERY"
+        
+        # Check for UPDATE patterns after QUERY
+        if any(pattern in last_method for pattern in update_patterns):
+            return "UPDATE"
+    
+    # Analyze results structure if no operations
+    if results_shape is not None:
+        # Look for success/error patterns (typical of UPDATE operations)
+        for shape in results_shape:
+            if isinstance(shape, tuple):
+                _, has_success, has_error = shape
+                if has_success:
+                    return "UPDATE"
+                if has_error:
+                    return "ERROR"
+        
+        # If we have arrays of data, likely a QUERY
+        if "list" in results_shape:
+            return "QUERY"
+    
+    return "UNKNOWN"
+
+
+@lru_cache(maxsize=None)
+def _describe_sdk_methods(sdk_cls: type) -> tuple:
+    """Signatures of the public SDK methods, as listed in the planning prompt"""
+    method_signatures = []
+    for method_name in dir(sdk_cls):
+        if method_name.startswith('_'):
+            continue
+        method = getattr(sdk_cls, method_name)
+        if callable(method):
+            # Get actual method signatures dynamically using introspection
+            sig = inspect.signature(method)
+            params = []
+            for param_name, param in sig.parameters.items():
+                if param_name != 'self':
+                    if param.default != inspect.Parameter.empty:
+                        params.append(f"{param_name}={repr(param.default)}")
+                    else:
+                        params.append(param_name)
+            method_signatures.append(f"• {method_name}({', '.join(params)})")
+    return tuple(method_signatures)
+
+
 class MetaAdsAgent:
     """Simple Meta Ads agent that can think and use tools"""
     
@@ -142,7 +237,7 @@ Think through this and return your reasoning as JSON:
             content = response.content
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
-            thought = json.loads(content)
+            thought = orjson.loads(content)
             
             # Store in thinking history
             self.thinking_history.append({
@@ -284,45 +379,19 @@ Think through this and return your reasoning as JSON:
         AUTONOMOUS PATTERN RECOGNITION - Recognizes operation type from response
         No hardcoded field checks - pure pattern recognition
         """
-        # Analyze operations if present - check LAST operation as it determines the type
+        # Reduce the response to a hashable key so repeated shapes hit the cache
+        last_method = None
         if "operations" in sdk_response:
             operations = sdk_response["operations"]
-            
-            # Look for patterns in operation names - use word boundaries
-            # Check for common prefixes/patterns in Meta SDK method names
-            update_patterns = ["update_", "set_", "modify_", "change_", "edit_"]
-            query_patterns = ["get_", "search_", "fetch_", "list_", "retrieve_", "_insights", "_metrics"]
-            
             # Check the LAST operation, as it determines the overall type
             if operations:
-                last_op = operations[-1]
-                method_name = last_op.get("sdk_method", "").lower()
-                
-                # Check for QUERY patterns FIRST (more specific)
-                if any(pattern in method_name for pattern in query_patterns):
-                    return "QUERY"
-                
-                # Check for UPDATE patterns after QUERY
-                if any(pattern in method_name for pattern in update_patterns):
-                    return "UPDATE"
+                last_method = operations[-1].get("sdk_method", "").lower()
         
-        # Analyze results structure if no operations
+        results_shape = None
         if "multi_step_results" in sdk_response:
-            results = sdk_response["multi_step_results"]
-            
-            # Look for success/error patterns (typical of UPDATE operations)
-            for result in results:
-                if isinstance(result, dict):
-                    if "success" in result or "updated" in result:
-                        return "UPDATE"
-                    if "error" in result:
-                        return "ERROR"
-            
-            # If we have arrays of data, likely a QUERY
-            if any(isinstance(r, list) for r in results):
-                return "QUERY"
+            results_shape = tuple(_result_shape(r) for r in sdk_response["multi_step_results"])
         
-        return "UNKNOWN"
+        return _classify_operation_pattern(last_method, results_shape)
     
     async def understand_request(self, state: AgentState) -> AgentState:
         """Understand what the user is asking for"""
@@ -333,24 +402,8 @@ Think through this and return your reasoning as JSON:
         logger.info(f"Initial thinking complete: {thought.get('pattern_recognized')}")
         
         # Use LLM to understand the request and plan SDK call
-        # Get available SDK methods dynamically
-        sdk_methods = [method for method in dir(self.sdk) if not method.startswith('_')]
-        
-        # Get actual method signatures dynamically using introspection
-        method_signatures = []
-        for method_name in sdk_methods:
-            if hasattr(self.sdk, method_name):
-                method = getattr(self.sdk, method_name)
-                if callable(method):
-                    sig = inspect.signature(method)
-                    params = []
-                    for param_name, param in sig.parameters.items():
-                        if param_name != 'self':
-                            if param.default != inspect.Parameter.empty:
-                                params.append(f"{param_name}={repr(param.default)}")
-                            else:
-                                params.append(param_name)
-                    method_signatures.append(f"• {method_name}({', '.join(params)})")
+        # Get available SDK methods dynamically (introspected once per SDK class)
+        method_signatures = _describe_sdk_methods(type(self.sdk))
         
         # Build the system prompt without f-string for the JSON examples
         system_prompt = """You are an intelligent Meta Ads assistant. 
@@ -717,7 +770,7 @@ IMPORTANT:
             content = response.content
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
-            plan = json.loads(content)
+            plan = orjson.loads(content)
         except:
             # Fallback to simple campaign list
             plan = {
@@ -1269,7 +1322,9 @@ Keep response under 1500 chars. Be concise and professional."""
         logger.info(f"Formatting {operation_pattern} response with data keys: {sdk_response.keys() if isinstance(sdk_response, dict) else type(sdk_response)}")
         
         # Prepare data for LLM - send the full response without looking for specific fields
-        data_str = json.dumps(sdk_response, indent=2)
+        data_str = orjson.dumps(
+            sdk_response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
         if len(data_str) > 8000:
             data_str = data_str[:8000]
             logger.info("Response truncated to 8000 chars")
@@ -0,0 +1,146 @@
+"""
+Shared pytest configuration for the agent tests
+"""
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import orjson
+import pytest
+from dotenv import load_dotenv
+from facebook_business.api import FacebookAdsApi, FacebookResponse
+
+from tools import meta_sdk
+from tools.meta_sdk import MetaAdsSDK, configure_http_session
+
+
+class FakeLLM:
+    """Stand-in for agent.llm that answers every ainvoke with fixed content"""
+    
+    def __init__(self, content: str):
+        self._content = content
+    
+    async def ainvoke(self, *args, **kwargs):
+        return SimpleNamespace(content=self._content)
+
+
+class FakeGraph:
+    """Stand-in for the Graph call behind FacebookAdsApi.call (batch requests)
+    
+    answer(request) returns each batch entry's sub-response, or None for a
+    null one; by default every request succeeds. With fail_call set, that
+    call (1-based) raises a connection error instead.
+    """
+    
+    def __init__(self):
+        self.batch_sizes = []
+        self.fail_call = None
+        self.answer = lambda request: self.ok()
+    
+    @staticmethod
+    def ok(body: dict = None) -> dict:
+        return {"code": 200, "headers": [], "body": orjson.dumps(body or {"success": True}).decode()}
+    
+    @staticmethod
+    def error(message: str, code: int = 100) -> dict:
+        body = {"error": {"message": message, "code": code}}
+        return {"code": 400, "headers": [], "body": orjson.dumps(body).decode()}
+    
+    def __call__(self, api, method, path, params=None, *args, **kwargs):
+        requests = params["batch"]
+        self.batch_sizes.append(len(requests))
+        if len(self.batch_sizes) == self.fail_call:
+            raise ConnectionError("Connection reset by peer")
+        body = [self.answer(request) for request in requests]
+        return FacebookResponse(body=orjson.dumps(body), http_status=200, headers={})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """Parse .env once per test session"""
+    load_dotenv()
+    return os.environ
+
+
+@pytest.fixture(scope="session")
+def fb_api(_env):
+    """Initialize the Facebook API once; tests that ask for it share its HTTP session"""
+    api = FacebookAdsApi.init(
+        access_token=os.getenv("META_ACCESS_TOKEN"),
+        api_version="v21.0"
+    )
+    # Same pooled keep-alive adapter the SDK uses, ready before any test runs
+    configure_http_session(api)
+    yield api
+
+
+@pytest.fixture(scope="session", autouse=True)
+def llm_cache(request):
+    """LangChain LLM cache for the test session, restored on teardown
+    
+    Identical prompts (think() contexts, repeated scenarios) are answered
+    once per session. The agent calls llm.ainvoke directly, so the global
+    cache intercepts every call. With langchain-community installed the
+    cache lives on disk under .pytest_cache and survives re-runs.
+    """
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError:
+        SQLiteCache = None
+    
+    cache_dir = request.config.cache.mkdir("langchain") if getattr(request.config, "cache", None) else None
+    if SQLiteCache is not None and cache_dir is not None:
+        cache = SQLiteCache(database_path=str(cache_dir / "llm_cache.sqlite"))
+    else:
+        cache = InMemoryCache()
+    
+    previous = get_llm_cache()
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(previous)
+
+
+@pytest.fixture(scope="session")
+def agent(fb_api):
+    """One MetaAdsAgent (SDK client, LLM, compiled graph) shared by all tests"""
+    # Imported here so unit tests don't load the LangGraph/OpenAI stack
+    from agents.meta_ads_agent import MetaAdsAgent
+    return MetaAdsAgent()
+
+
+@pytest.fixture
+def fake_graph():
+    """FakeGraph answering every Graph call the SDK makes during the test"""
+    graph = FakeGraph()
+    with mock.patch.object(meta_sdk, "_original_api_call", graph):
+        yield graph
+
+
+@pytest.fixture
+def make_sdk():
+    """MetaAdsSDK factory; each SDK's read cache starts and ends the test empty"""
+    made = []
+    
+    def factory(cache_backend: str = "none") -> MetaAdsSDK:
+        sdk = MetaAdsSDK(cache_backend=cache_backend)
+        sdk._invalidate_cache()
+        made.append(sdk)
+        return sdk
+    
+    yield factory
+    for sdk in made:
+        sdk._invalidate_cache()
+
+
+@pytest.fixture
+def sdk(make_sdk):
+    """Uncached MetaAdsSDK"""
+    return make_sdk()
+
+
+@pytest.fixture
+def fake_llm():
+    """FakeLLM factory - call it with the content every ainvoke should return"""
+    return FakeLLM
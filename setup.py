@@ -29,6 +29,14 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # META_CACHE_BACKEND=redis
+        "redis": ["redis>=5.0.0"],
+        # Speeds up multi-term name/city searches; no wheels on some platforms
+        "search": ["hyperscan>=0.7.0"],
+        # tools.insights_frame; numba compiles its ROAS ranking
+        "analytics": ["pandas>=2.0.0", "numba>=0.58.0"],
+    },
     entry_points={
         "console_scripts": [
             "meta-ads-bot=main:main",
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test the concurrent bulk insights fan-out against a stubbed aiohttp session"""
+from unittest import mock
+
+import aiohttp
+import orjson
+
+from tools import meta_sdk
+
+# object id -> response body, or an exception the request raises
+RESPONSES = {
+    "1": orjson.dumps({"data": [{"adset_name": "Miami", "spend": "12.50"}]}),
+    "2": orjson.dumps({"data": []}),
+    "3": orjson.dumps({"error": {"message": "(#100) Invalid parameter", "code": 100}}),
+    "4": orjson.dumps({"error": "Service temporarily unavailable"}),
+    "5": b"<html>502 Bad Gateway</html>",
+    "6": aiohttp.ClientConnectionError("Connection reset by peer"),
+}
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.headers = {}
+        self._body = body
+
+    async def json(self, loads, content_type=None):
+        return loads(self._body)
+
+
+class FakeRequest:
+    def __init__(self, outcome):
+        self._outcome = outcome
+
+    async def __aenter__(self):
+        if isinstance(self._outcome, Exception):
+            raise self._outcome
+        return FakeResponse(self._outcome)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in answering from RESPONSES by object id"""
+
+    def __init__(self, *args, **kwargs):
+        self.timeout = kwargs.get("timeout")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, url, params=None, headers=None):
+        object_id = url.rsplit("/", 2)[-2]
+        return FakeRequest(RESPONSES[object_id])
+
+
+def test_bulk_insights_returns_one_row_per_id(sdk):
+    with mock.patch.object(meta_sdk.aiohttp, "ClientSession", FakeSession):
+        rows = sdk.get_insights_bulk(list(RESPONSES))
+    assert [row["id"] for row in rows] == list(RESPONSES)
+    assert rows[0]["spend_dollars"] == 12.5
+    assert rows[1] == {"id": "2", "message": "No insights data available"}
+    assert rows[2] == {"id": "3", "error": "(#100) Invalid parameter"}
+    assert rows[3] == {"id": "4", "error": "Service temporarily unavailable"}
+    # A non-JSON 5xx body and a dropped connection fail only their own id
+    assert "error" in rows[4]
+    assert rows[5] == {"id": "6", "error": "Connection reset by peer"}
+
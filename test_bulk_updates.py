@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test batched adset writes: per-item error mapping and 50-per-call chunking"""
+from unittest import mock
+
+import pytest
+
+from tools.meta_sdk import MetaAdsSDK
+
+
+@pytest.fixture
+def graph(fake_graph):
+    """Fake Graph where adsets whose id ends in 9 are rejected"""
+    fake_graph.answer = lambda request: (
+        fake_graph.error("Invalid budget")
+        if request["relative_url"].split("/")[0].endswith("9")
+        else fake_graph.ok()
+    )
+    return fake_graph
+
+
+def test_single_write(sdk, graph):
+    assert sdk.update_adset_budget("12340", daily_budget=200)["updated_fields"] == {"daily_budget": 20000}
+    result = sdk.pause_adset("12349")
+    assert result == {"error": "Facebook API error: Invalid budget", "code": 100}
+    assert graph.batch_sizes == [1, 1]
+
+
+def test_bulk_update_splits_updated_and_failed(sdk, graph):
+    updates = [{"adset_id": "1000", "budget": 50}, {"id": "1009", "status": "PAUSED"}, {"adset_id": "1002", "lifetime_budget": 1}]
+    result = sdk.bulk_update_adsets(updates)
+    assert result["success"]
+    assert [u["adset_id"] for u in result["updated"]] == ["1000", "1002"]
+    assert result["updated"][1]["updated_fields"] == {"lifetime_budget": 100}
+    assert result["failed"] == [{"adset_id": "1009", "error": "Facebook API error: Invalid budget"}]
+
+
+def test_bulk_update_chunks_at_batch_limit(sdk, graph):
+    ids = [str(2000 + i) for i in range(120)]
+    result = sdk.bulk_pause_adsets(ids)
+    assert graph.batch_sizes == [50, 50, 20]
+    assert len(result["updated"]) == 108 and len(result["failed"]) == 12
+    # Results stay aligned with their ids across chunks
+    assert all(f["adset_id"].endswith("9") for f in result["failed"])
+
+
+def test_failed_chunk_keeps_earlier_results(sdk, graph):
+    graph.fail_call = 2
+    ids = [str(3000 + i) for i in range(60)]
+    with mock.patch.object(MetaAdsSDK, "_invalidate_cache", autospec=True) as invalidate:
+        result = sdk.bulk_pause_adsets(ids)
+    invalidate.assert_called_once()
+    assert graph.batch_sizes == [50, 10]
+    # First chunk: 45 landed, 5 rejected; the second chunk's call never answered
+    assert len(result["updated"]) == 45
+    assert len(result["failed"]) == 15
+    assert result["failed"][-1] == {"adset_id": "3059", "error": "Connection reset by peer"}
@@ -2,7 +2,6 @@
 """Test Meta API directly to diagnose rate limit issue"""
 from dotenv import load_dotenv
 from tools.meta_sdk import MetaAdsSDK
-import os
 
 load_dotenv()
 
@@ -16,8 +15,7 @@ print("\n1. Testing get_all_campaigns:")
 campaigns = sdk.get_all_campaigns()
 if isinstance(campaigns, list):
     print(f"   ✅ Success: Found {len(campaigns)} campaigns")
-    for c in campaigns[:3]:
-        print(f"      - {c.get('name', 'Unknown')}")
+    print('\n'.join(f"      - {c.get('name', 'Unknown')}" for c in campaigns[:3]))
 else:
     print(f"   ❌ Error: {campaigns}")
 
@@ -37,8 +35,9 @@ if isinstance(ryan_campaigns, list) and len(ryan_campaigns) > 0:
         print(f"   ❌ Error: {adsets['error']}")
     elif isinstance(adsets, list):
         print(f"   ✅ Success: Found {len(adsets)} adsets")
-        for adset in adsets:
-            print(f"      - {adset.get('name', 'Unknown')} (ID: {adset.get('id')})")
+        print('\n'.join(
+            f"      - {adset.get('name', 'Unknown')} (ID: {adset.get('id')})" for adset in adsets
+        ))
             
         # Test 4: Try to update Brooklyn budget
         brooklyn = next((a for a in adsets if 'brooklyn' in a.get('name', '').lower()), None)
@@ -57,9 +56,8 @@ else:
 # Test 5: Try getting account info
 print("\n5. Testing account access:")
 try:
-    from facebook_business.adobjects.adaccount import AdAccount
-    account = AdAccount(f"act_{os.getenv('META_AD_ACCOUNT_ID')}")
-    info = account.api_get(fields=['name', 'account_status'])
+    # Reuse the SDK's account object (act_ prefix already applied once in __init__)
+    info = sdk.account.api_get(fields=['name', 'account_status'])
     print(f"   ✅ Account Name: {info.get('name')}")
     print(f"   ✅ Account Status: {info.get('account_status')}")
 except Exception as e:
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import re
 from dotenv import load_dotenv
 from tools.meta_sdk import MetaAdsSDK
 
@@ -18,28 +19,40 @@ fb_ui = {
     'LA': 336.10
 }
 
+# Normalized lookup so adsets can be matched by name in any order
+FB_UI_NORM = {k.lower(): (k, v) for k, v in fb_ui.items()}
+
 campaigns = sdk.search_campaigns('Ryan')
 if campaigns:
     adsets = sdk.get_adsets_for_campaign(campaigns[0]['id'])
     
-    print(f'{"City":20} | {"SDK Value":>10} | {"FB UI":>10} | {"Match?":>8}')
-    print('-' * 70)
+    # Build the table in memory and write it once at the end
+    lines = [
+        f'{"City":20} | {"SDK Value":>10} | {"FB UI":>10} | {"Match?":>8}',
+        '-' * 70
+    ]
     
     total_sdk = 0
-    city_names = ['Retargeting', 'Brooklyn', 'Miami', 'Houston', 'Chicago', 'LA']
     
-    for i, adset in enumerate(adsets):
+    for adset in adsets:
+        # Match on whole words so short keys like 'la' don't hit inside other names
+        name_words = re.findall(r'[a-z]+', adset['name'].lower())
+        key = next((k for k in FB_UI_NORM if k in name_words), None)
+        if key is None:
+            lines.append(f'{adset["name"][:20]:20} | no Facebook UI value to compare')
+            continue
+        
         insights = sdk.get_adset_insights(adset['id'], date_preset='maximum')
         if isinstance(insights, dict) and 'error' not in insights:
             # Should now be in dollars, no division needed
             spend = insights.get('spend_dollars', 0)
-            city = city_names[i]
-            fb_value = fb_ui[city]
+            city, fb_value = FB_UI_NORM[key]
             
             match = 'YES ✅' if abs(spend - fb_value) < 0.01 else 'NO ❌'
             
-            print(f'{city:20} | ${spend:9.2f} | ${fb_value:9.2f} | {match:>8}')
+            lines.append(f'{city:20} | ${spend:9.2f} | ${fb_value:9.2f} | {match:>8}')
             total_sdk += spend
     
-    print('-' * 70)
-    print(f'{"TOTAL":20} | ${total_sdk:9.2f} | ${1620.08:9.2f} | {"YES ✅" if abs(total_sdk - 1620.08) < 1 else "NO ❌":>8}')
\ No newline at end of file
+    lines.append('-' * 70)
+    lines.append(f'{"TOTAL":20} | ${total_sdk:9.2f} | ${1620.08:9.2f} | {"YES ✅" if abs(total_sdk - 1620.08) < 1 else "NO ❌":>8}')
+    print('\n'.join(lines), flush=True)
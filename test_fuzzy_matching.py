@@ -4,6 +4,7 @@ Test fuzzy matching functionality with typos
 """
 
 import asyncio
+import re
 import sys
 import os
 from pathlib import Path
@@ -16,6 +17,16 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# One compiled pass over the request replaces the words x adsets substring scan
+CITY_RE = re.compile(r'\b(brooklyn|miami|houston|chicago|la|retargeting)\b', re.I)
+
+# Simulated adsets from a previous "get_adsets_for_campaign" step
+MOCK_ADSETS = [
+    {"id": "120232176000230525", "name": "Sende Tour - Retargeting"},
+    {"id": "120232009098430525", "name": "Sende Tour - Brooklyn"},
+    {"id": "120232009098430526", "name": "Sende Tour - Miami"}
+]
+
 async def test_fuzzy_matching():
     """Test that the agent can handle typos in adset names"""
     
@@ -79,37 +90,31 @@ async def test_fuzzy_matching():
         # Test with actual SDK call simulation
         print(f"\n   Testing full flow...")
         
-        # Simulate having adsets from previous step
-        mock_adsets = [
-            {"id": "120232176000230525", "name": "Sende Tour - Retargeting"},
-            {"id": "120232009098430525", "name": "Sende Tour - Brooklyn"},
-            {"id": "120232009098430526", "name": "Sende Tour - Miami"}
-        ]
-        
-        # Test the matching logic
-        words = test["request"].split()
         best_match = None
         best_confidence = 0
         
-        for adset in mock_adsets:
-            adset_name = adset["name"].lower()
-            for word in words:
-                if len(word) > 2:
-                    if word.lower() in adset_name:
-                        print(f"   ✅ Exact match found: '{word}' in '{adset['name']}'")
-                        best_match = adset
-                        best_confidence = 100
-                        break
-                    else:
-                        # Simulate fuzzy matching thought
-                        fuzzy_context = f"Is '{word}' likely a typo of any part of '{adset_name}'?"
-                        fuzzy_thought = await agent.think(fuzzy_context)
-                        score = fuzzy_thought.get('similarity_score', 0)
-                        if score > 70:
-                            print(f"   🔍 Fuzzy match: '{word}' ~ '{adset['name']}' (score: {score})")
-                            if score > best_confidence:
-                                best_match = adset
-                                best_confidence = score
+        # Exact city names are resolved by the regex alone
+        m = CITY_RE.search(test["request"])
+        city = m.group(1).lower() if m else None
+        if city:
+            best_match = next((a for a in MOCK_ADSETS if city in a["name"].lower()), None)
+            if best_match:
+                print(f"   ✅ Exact match found: '{m.group(1)}' in '{best_match['name']}'")
+                best_confidence = 100
+        else:
+            # Only typos fall through to the (slow) fuzzy thinking path
+            words = [w for w in test["request"].split() if len(w) > 2]
+            for adset in MOCK_ADSETS:
+                adset_name = adset["name"].lower()
+                for word in words:
+                    fuzzy_context = f"Is '{word}' likely a typo of any part of '{adset_name}'?"
+                    fuzzy_thought = await agent.think(fuzzy_context)
+                    score = fuzzy_thought.get('similarity_score', 0)
+                    if score > 70:
+                        print(f"   🔍 Fuzzy match: '{word}' ~ '{adset['name']}' (score: {score})")
+                        if score > best_confidence:
+                            best_match = adset
+                            best_confidence = score
         
         if best_match and best_confidence >= 70:
             print(f"   ✨ Selected: {best_match['name']} (confidence: {best_confidence}%)")
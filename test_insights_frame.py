@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test the columnar insights frame used by analytics callers"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+from tools.insights_frame import insights_frame, top_cities_by_roas
+
+ROWS = [
+    {"id": "1", "adset_name": "Brooklyn", "spend": "388.08", "impressions": "5000",
+     "clicks": "120", "ctr": "2.4", "purchase_roas": [{"action_type": "omni_purchase", "value": "3.5"}]},
+    {"id": "2", "adset_name": "Miami", "spend": "245.23", "impressions": "3000", "clicks": None},
+    {"id": "3", "error": "Unsupported get request"},
+    {"id": "4", "adset_name": "Houston", "spend": "12.00", "impressions": "300",
+     "purchase_roas": [{"action_type": "omni_purchase", "value": "9.0"}]},
+    {"id": "5", "adset_name": "Chicago", "spend": "150.00", "impressions": "2000",
+     "purchase_roas": [{"action_type": "omni_purchase", "value": "4.2"}]},
+]
+
+
+def test_insights_frame():
+    frame = insights_frame(ROWS)
+    assert list(frame["id"]) == ["1", "2", "4", "5"], "Error rows should be skipped"
+    assert frame["spend"].dtype == "float64"
+    assert frame["impressions"].dtype == "int64"
+    assert frame["clicks"].tolist() == [120, 0, 0, 0]
+    assert frame["ctr"].dtype == "float32"
+    assert frame["roas"].tolist() == [3.5, 0.0, 9.0, 4.2]
+    assert frame["spend_dollars"].sum() == pytest.approx(795.31)
+
+
+def test_top_cities_by_roas():
+    frame = insights_frame(ROWS)
+    top = top_cities_by_roas(frame, n=2, min_spend=100)
+    # Houston has the best ROAS but spends under the threshold
+    assert top["adset_name"].tolist() == ["Chicago", "Brooklyn"]
+    assert top_cities_by_roas(frame, n=1)["adset_name"].tolist() == ["Houston"]
+
+
+if __name__ == "__main__":
+    test_insights_frame()
+    test_top_cities_by_roas()
+    print("✅ Insights frame tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Test that query() reaches the ad account for every account-level operation"""
+from unittest import mock
+
+import pytest
+from facebook_business.adobjects.adaccount import AdAccount
+from facebook_business.exceptions import FacebookRequestError
+
+ROW = {"id": "1", "name": "Row"}
+
+# operation, params, AdAccount edge it should read
+QUERY_CASES = [
+    pytest.param("campaigns", None, "get_campaigns", id="campaigns"),
+    pytest.param("active_campaigns", None, "get_campaigns", id="active_campaigns"),
+    pytest.param("adsets", None, "get_ad_sets", id="adsets"),
+    pytest.param("ads", None, "get_ads", id="ads"),
+    pytest.param("audiences", None, "get_custom_audiences", id="audiences"),
+    pytest.param("creatives", None, "get_ad_creatives", id="creatives"),
+]
+
+
+@pytest.fixture
+def sdk(make_sdk):
+    """Uncached SDK whose ad account is a mock returning one row per edge"""
+    sdk = make_sdk()
+    sdk.account = mock.create_autospec(AdAccount, instance=True)
+    row = mock.Mock(export_all_data=mock.Mock(return_value=dict(ROW)))
+    for edge in ("get_campaigns", "get_ad_sets", "get_ads", "get_custom_audiences", "get_ad_creatives"):
+        getattr(sdk.account, edge).return_value = [row]
+    return sdk
+
+
+@pytest.mark.parametrize("operation, params, edge", QUERY_CASES)
+def test_query_operation(sdk, operation, params, edge):
+    result = sdk.query(operation, params)
+    assert result == [ROW], f"{operation} returned {result}"
+    getattr(sdk.account, edge).assert_called_once()
+
+
+def test_search_operation(sdk):
+    result = sdk.query("search", {"name": "Row"})
+    assert result == [{"type": "campaign", **ROW}, {"type": "adset", **ROW}], f"search returned {result}"
+    sdk.account.get_campaigns.assert_called_once()
+    sdk.account.get_ad_sets.assert_called_once()
+
+
+def _graph_error(code):
+    body = f'{{"error": {{"message": "Graph error {code}", "code": {code}}}}}'
+    return FacebookRequestError("Call was not successful", {}, 400, {}, body)
+
+
+def test_search_falls_back_on_rejected_filter(sdk):
+    sdk.account.get_campaigns.side_effect = [_graph_error(100), sdk.account.get_campaigns.return_value]
+    assert sdk.search_campaigns("Row") == [ROW]
+    assert sdk.account.get_campaigns.call_count == 2
+
+
+def test_search_reports_rate_limits(sdk):
+    sdk.account.get_ad_sets.side_effect = _graph_error(80004)
+    result = sdk.search_adsets(city="Row")
+    assert result["code"] == 80004, f"search returned {result}"
+    sdk.account.get_ad_sets.assert_called_once()
+
+
+def test_performance_reports_missing_batch_response(make_sdk, fake_graph):
+    # Insights answer; the campaign count comes back as a null sub-response
+    fake_graph.answer = lambda request: (
+        fake_graph.ok({"data": [{"spend": "5"}]}) if "/insights" in request["relative_url"] else None
+    )
+    result = make_sdk().get_performance_metrics()
+    assert result == {"error": "No response from Facebook for campaigns"}
+
+
+def test_search_operation_reports_a_failed_side(sdk):
+    sdk.account.get_ad_sets.side_effect = _graph_error(80004)
+    result = sdk.query("search", {"query": "Row"})
+    assert result[0] == {"type": "campaign", **ROW}
+    assert result[1]["type"] == "adset" and result[1]["code"] == 80004, f"search returned {result}"
+
+
+def test_unknown_operation(sdk):
+    assert sdk.query("nope") == {"error": "Unknown operation: nope"}
+
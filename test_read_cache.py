@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test the SDK's read cache: what gets cached, and invalidation on writes"""
+from unittest import mock
+
+import pytest
+from facebook_business.adobjects.adaccount import AdAccount
+
+from tools import meta_sdk
+from tools.meta_sdk import MetaAdsSDK
+
+ROW = {"id": "1", "name": "Row", "daily_budget": "10000"}
+
+
+@pytest.fixture
+def sdk(make_sdk):
+    """SDK on the in-memory read cache, starting from an empty cache"""
+    return make_sdk("memory")
+
+
+def test_write_invalidates_cached_reads(sdk, fake_graph):
+    sdk.account = mock.create_autospec(AdAccount, instance=True)
+    row = mock.Mock(export_all_data=mock.Mock(side_effect=lambda: dict(ROW)))
+    sdk.account.get_campaigns.return_value = [row]
+
+    assert sdk.get_all_campaigns() == [ROW]
+    assert sdk.get_all_campaigns() == [ROW]
+    assert sdk.account.get_campaigns.call_count == 1, "Second read should come from cache"
+
+    result = sdk.update_adset_budget("67890", daily_budget=200)
+    assert result.get("success"), f"Update failed: {result}"
+
+    sdk.get_all_campaigns()
+    assert sdk.account.get_campaigns.call_count == 2, "A write should drop cached reads"
+
+
+def test_bulk_rows_with_errors_are_not_cached(sdk):
+    rows = [{"id": "1", "spend": "5"}, {"id": "2", "error": "(#80004) Too many calls"}]
+    fetch = mock.AsyncMock(return_value=rows)
+    with mock.patch.object(MetaAdsSDK, "_get_insights_bulk_async", fetch):
+        assert sdk.get_insights_bulk(["1", "2"]) == rows
+        sdk.get_insights_bulk(["1", "2"])
+    assert fetch.await_count == 2, "A result with an error row should be refetched"
+
+    fetch = mock.AsyncMock(return_value=rows[:1])
+    with mock.patch.object(MetaAdsSDK, "_get_insights_bulk_async", fetch):
+        sdk.get_insights_bulk(["1"])
+        assert sdk.get_insights_bulk(["1"]) == rows[:1]
+    assert fetch.await_count == 1, "An error-free result should be served from cache"
+
+
+class BrokenCache:
+    """Cache backend that is down, like an unreachable Redis"""
+
+    def get(self, key):
+        raise ConnectionError("Error 111 connecting to localhost:6379")
+
+    set = clear_prefix = get
+
+
+def test_unavailable_cache_falls_through_to_graph(sdk, fake_graph):
+    sdk._cache = BrokenCache()
+    sdk.account = mock.create_autospec(AdAccount, instance=True)
+    sdk.account.get_campaigns.return_value = [mock.Mock(export_all_data=mock.Mock(return_value=dict(ROW)))]
+    assert sdk.get_all_campaigns() == [ROW]
+    assert sdk.update_adset_budget("67890", daily_budget=200).get("success")
+
+
+def test_adset_listing_ttl_ignores_date_range_without_insights(sdk):
+    sdk._cache = mock.Mock(get=mock.Mock(return_value=None))
+    campaign = mock.Mock(get_ad_sets=mock.Mock(return_value=[]))
+    with mock.patch.object(meta_sdk, "_campaign", return_value=campaign):
+        sdk.get_adsets_for_campaign("1")
+        sdk.get_adsets_for_campaign("1", with_insights=True, date_preset="maximum")
+    ttls = [call.args[2] for call in sdk._cache.set.call_args_list]
+    assert ttls == [meta_sdk._DEFAULT_READ_TTL, meta_sdk._READ_TTLS["maximum"]]
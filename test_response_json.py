@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Test that Graph responses are parsed with orjson, falling back to json"""
+from facebook_business.api import FacebookResponse
+
+from tools import meta_sdk
+
+
+def test_response_json_uses_orjson():
+    assert FacebookResponse.json is meta_sdk._orjson_response_json
+    response = FacebookResponse(body='{"data": [{"id": "1", "spend": "388.08"}]}', http_status=200)
+    assert response.json() == {"data": [{"id": "1", "spend": "388.08"}]}
+
+
+def test_response_json_falls_back_to_stdlib():
+    # orjson rejects NaN; the stdlib parser accepts it
+    response = FacebookResponse(body='{"roas": NaN}', http_status=200)
+    assert response.json()["roas"] != response.json()["roas"]
+    # Non-JSON bodies still come back as the raw string
+    assert FacebookResponse(body="true-ish", http_status=200).json() == "true-ish"
+
+
+if __name__ == "__main__":
+    test_response_json_uses_orjson()
+    test_response_json_falls_back_to_stdlib()
+    print("✅ Response JSON tests passed!")
@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 """
 Test script to verify all components are working
+
+Offline by default. Pass --live (or set SETUP_LIVE_CHECK=1) to also call
+the Meta and OpenAI APIs.
 """
+import importlib.util
 import os
 import sys
+import time
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
+# Network probes are opt-in; a successful live run is remembered for an hour
+LIVE = "--live" in sys.argv[1:] or bool(os.getenv("SETUP_LIVE_CHECK"))
+LIVE_OK_FILE = Path.home() / ".cache" / "outlet-media-bot" / "setup_ok"
+LIVE_OK_TTL = 3600
+
+if LIVE and LIVE_OK_FILE.exists() and time.time() - LIVE_OK_FILE.stat().st_mtime < LIVE_OK_TTL:
+    print("ℹ️  Live API check passed within the last hour, skipping network calls")
+    LIVE = False
+
 print("🧪 Testing Meta Ads Discord Bot Setup")
 print("=" * 40)
 
@@ -31,12 +46,13 @@ required_packages = {
     'pydantic': 'pydantic'
 }
 
+# find_spec only locates the package; its module body is not executed.
+# The real imports happen once, in Test 4.
 missing_packages = []
 for module, package in required_packages.items():
-    try:
-        __import__(module)
+    if importlib.util.find_spec(module) is not None:
         print(f"✅ {package}")
-    except ImportError:
+    else:
         print(f"❌ {package} not installed")
         missing_packages.append(package)
 
@@ -93,30 +109,44 @@ except Exception as e:
 
 # Test 5: Test Meta SDK connection
 print("\n5. Testing Meta SDK connection...")
+meta_ok = False
 try:
     from tools.meta_sdk import MetaAdsSDK
     sdk = MetaAdsSDK()
-    # Try to get campaigns (will fail if credentials are wrong)
-    result = sdk.get_all_campaigns()
-    if isinstance(result, dict) and "error" in result:
-        print(f"⚠️  Meta SDK initialized but API error: {result['error'][:100]}")
+    if LIVE:
+        # Try to get campaigns (will fail if credentials are wrong)
+        result = sdk.get_all_campaigns()
+        if isinstance(result, dict) and "error" in result:
+            print(f"⚠️  Meta SDK initialized but API error: {result['error'][:100]}")
+        else:
+            print(f"✅ Meta SDK connected! Found {len(result)} campaigns")
+            meta_ok = True
     else:
-        print(f"✅ Meta SDK connected! Found {len(result)} campaigns")
+        print("✅ Meta SDK initialized (run with --live to test the API)")
 except Exception as e:
     print(f"❌ Meta SDK connection failed: {e}")
     print("Check your META_ACCESS_TOKEN and META_AD_ACCOUNT_ID")
 
 # Test 6: Test OpenAI connection
 print("\n6. Testing OpenAI connection...")
+openai_ok = False
 try:
     from langchain_openai import ChatOpenAI
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
-    response = llm.invoke("Say 'API Connected' in 3 words")
-    print(f"✅ OpenAI connected: {response.content}")
+    if LIVE:
+        response = llm.invoke("Say 'API Connected' in 3 words")
+        print(f"✅ OpenAI connected: {response.content}")
+        openai_ok = True
+    else:
+        print("✅ OpenAI client initialized (run with --live to test the API)")
 except Exception as e:
     print(f"❌ OpenAI connection failed: {e}")
     print("Check your OPENAI_API_KEY")
 
+if meta_ok and openai_ok:
+    LIVE_OK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    LIVE_OK_FILE.touch()
+
 print("\n" + "=" * 40)
 print("✅ All tests passed! Bot is ready to run.")
 print("\nRun with: python main.py")
@@ -1,21 +1,31 @@
 #!/usr/bin/env python3
 """Test agent handling of success vs failure scenarios"""
 import asyncio
-from dotenv import load_dotenv
+import re
+import pytest
 from agents.meta_ads_agent import MetaAdsAgent
 
-load_dotenv()
+# Response probes, compiled once; each check is one pass with no lowercased copy
+ERROR_RE = re.compile(r"error|unable|not found", re.I)
+NOT_FOUND_RE = re.compile(r"unable|not found", re.I)
+UNABLE_RE = re.compile(r"unable", re.I)
+HALLUCINATED_RE = re.compile(r"\$(?:385|317|286)")
 
-async def test_scenarios():
-    agent = MetaAdsAgent()
+@pytest.mark.asyncio(loop_scope="session")
+async def test_scenarios(agent):
+    # The scenarios are independent, so run them concurrently and check in order
+    response1, response2, response3 = await asyncio.gather(
+        agent.process_request("update budget for FAKECAMPAIGN brooklyn to $300"),
+        agent.process_request("show me spend for Ryan Castro campaign in FAKECITY"),
+        agent.process_request("show me the total spend for Ryan Castro campaign")
+    )
     
     print("SCENARIO 1: Request with non-existent campaign")
     print("=" * 70)
-    response1 = await agent.process_request("update budget for FAKECAMPAIGN brooklyn to $300")
     print(response1)
     
     # Check response
-    if "error" in response1.lower() or "unable" in response1.lower() or "not found" in response1.lower():
+    if ERROR_RE.search(response1):
         print("\n✅ Correctly reported error for non-existent campaign")
     else:
         print("\n❌ Failed to report error properly")
@@ -23,16 +33,15 @@ async def test_scenarios():
     print("\n" + "=" * 70)
     print("\nSCENARIO 2: Request with typo in city name")
     print("=" * 70)
-    response2 = await agent.process_request("show me spend for Ryan Castro campaign in FAKECITY")
     print(response2)
     
     # Check response
     if "$0" in response2 or "N/A" in response2:
         print("\n⚠️ Shows zero or N/A (acceptable)")
-    elif "unable" in response2.lower() or "not found" in response2.lower():
+    elif NOT_FOUND_RE.search(response2):
         print("\n✅ Correctly reported data not found")
     else:
-        amounts = [amt for amt in ["$385", "$317", "$286"] if amt in response2]
+        amounts = list(dict.fromkeys(HALLUCINATED_RE.findall(response2)))
         if amounts:
             print(f"\n❌ May be showing hallucinated values: {amounts}")
         else:
@@ -41,11 +50,10 @@ async def test_scenarios():
     print("\n" + "=" * 70)
     print("\nSCENARIO 3: Valid request (if API is working)")
     print("=" * 70)
-    response3 = await agent.process_request("show me the total spend for Ryan Castro campaign")
     print(response3)
     
     # Check if response has real data or properly reports unavailability
-    if "unable" in response3.lower():
+    if UNABLE_RE.search(response3):
         print("\n✅ Properly reported data unavailable")
     elif "$" in response3:
         print("\n✅ Shows monetary values (check if they're real)")
@@ -53,4 +61,7 @@ async def test_scenarios():
         print("\n⚠️ Unclear response")
 
 if __name__ == "__main__":
-    asyncio.run(test_scenarios())
\ No newline at end of file
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    asyncio.run(test_scenarios(MetaAdsAgent()))
\ No newline at end of file
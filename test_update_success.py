@@ -1,49 +1,27 @@
 #!/usr/bin/env python3
 """Test that UPDATE operations are correctly recognized as successful"""
-import asyncio
-from dotenv import load_dotenv
-from agents.meta_ads_agent import MetaAdsAgent
-import json
-from unittest.mock import AsyncMock, MagicMock
+from pathlib import Path
+import orjson
+import pytest
 
-load_dotenv()
+# Simulate the exact scenario from the user's issue:
+# "update budget on brooklyn ryan castro to 200 dollars"
+# Mock state with successful UPDATE operation, parsed once per process
+BASE_STATE = orjson.loads(
+    (Path(__file__).parent / "tests" / "fixtures" / "update_success.json").read_bytes()
+)
 
-async def test_update_success():
-    agent = MetaAdsAgent()
-    
+@pytest.fixture
+def state():
+    """Fresh copy per test - format_response mutates the state"""
+    # JSON round-trip is a faster deep copy for plain JSON-shaped data
+    return orjson.loads(orjson.dumps(BASE_STATE))
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_update_success(agent, monkeypatch, state, fake_llm):
     print("TEST: UPDATE Operation Success Recognition")
     print("=" * 70)
     
-    # Simulate the exact scenario from the user's issue:
-    # "update budget on brooklyn ryan castro to 200 dollars"
-    
-    # Mock state with successful UPDATE operation
-    state = {
-        "messages": [],
-        "current_request": "update budget on brooklyn ryan castro to 200 dollars",
-        "sdk_response": {
-            "request": "update budget on brooklyn ryan castro to 200 dollars",
-            "steps_executed": 3,
-            "operations": [
-                {"sdk_method": "search_campaigns", "parameters": {"query": "Ryan Castro"}},
-                {"sdk_method": "get_adsets_for_campaign", "parameters": {"campaign_id": "120232002620350525"}},
-                {"sdk_method": "update_adset_budget", "parameters": {"id": "120232176000230525", "daily_budget": 200}}
-            ],
-            "multi_step_results": [
-                {"id": "120232002620350525", "name": "Ryan Castro Campaign"},
-                [{"id": "120232176000230525", "name": "Brooklyn"}],
-                {"success": True, "message": "Successfully updated budget to $200"}
-            ],
-            "results": {
-                "step_1_results": {"id": "120232002620350525", "name": "Ryan Castro Campaign"},
-                "step_2_results": [{"id": "120232176000230525", "name": "Brooklyn"}],
-                "step_3_result": {"success": True, "message": "Successfully updated budget to $200"}
-            }
-        },
-        "final_answer": "",
-        "sdk_plan": {}
-    }
-    
     print("1. Testing pattern recognition for UPDATE operation:")
     print("-" * 50)
     
@@ -56,12 +34,11 @@ async def test_update_success():
     print("\n2. Testing format_response with UPDATE operation:")
     print("-" * 50)
     
-    # Mock the LLM to avoid actual API calls
-    original_llm = agent.llm
-    agent.llm = MagicMock()
-    mock_response = MagicMock()
-    mock_response.content = "✅ **Success**: Budget updated to $200 for Brooklyn in Ryan Castro campaign"
-    agent.llm.ainvoke = AsyncMock(return_value=mock_response)
+    # Fake the LLM to avoid actual API calls; monkeypatch restores it on teardown
+    monkeypatch.setattr(
+        agent, "llm",
+        fake_llm("✅ **Success**: Budget updated to $200 for Brooklyn in Ryan Castro campaign")
+    )
     
     # Test format_response
     result_state = await agent.format_response(state)
@@ -76,9 +53,6 @@ async def test_update_success():
     
     print("✅ Correctly formatted as SUCCESS (not error)")
     
-    # Restore original LLM
-    agent.llm = original_llm
-    
     print("\n" + "=" * 70)
     print("SUMMARY:")
     print("✅ UPDATE operations with 'success': true are correctly recognized")
@@ -88,6 +62,3 @@ async def test_update_success():
     print("- User updates budget successfully")
     print("- Bot correctly reports success, not error")
     print("- No hardcoded field checks required!")
-
-if __name__ == "__main__":
-    asyncio.run(test_update_success())
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test the back-off read from Meta's usage headers"""
+from unittest import mock
+
+import orjson
+import pytest
+from facebook_business.exceptions import FacebookRequestError
+
+from tools import meta_sdk
+from tools.meta_sdk import _throttle_delay, AccountBudget, _RATE_LIMIT_BACKOFF, _THROTTLED_CODE
+
+BUC = 'x-business-use-case-usage'
+INSIGHTS = 'x-fb-ads-insights-throttle'
+
+HEADER_CASES = [
+    pytest.param({BUC: {"123": [{"call_count": 50, "total_cputime": 10}]}}, 0, id="under_threshold"),
+    pytest.param({BUC: {"123": [{"call_count": 95}]}}, 25, id="over_threshold"),
+    pytest.param({BUC: {"123": [{"call_count": 95, "estimated_time_to_regain_access": 2}]}}, 120, id="regain_time"),
+    pytest.param({INSIGHTS: {"app_id_util_pct": 90, "acc_id_util_pct": 10}}, 20, id="insights_throttle"),
+    # Malformed shapes are ignored rather than raised
+    pytest.param({BUC: {"123": {"call_count": 95}}}, 0, id="entry_not_a_list"),
+    pytest.param({BUC: {"123": ["x", {"call_count": 95}]}}, 25, id="item_not_a_dict"),
+    pytest.param({INSIGHTS: {"app_id_util_pct": "90"}}, 0, id="pct_not_a_number"),
+]
+
+
+@pytest.mark.parametrize("headers, expected", HEADER_CASES)
+def test_throttle_delay(headers, expected):
+    encoded = {name: orjson.dumps(value).decode() for name, value in headers.items()}
+    assert _throttle_delay(encoded) == expected
+
+
+def test_budget_refuses_calls_during_back_off():
+    budget = AccountBudget()
+    budget.acquire()
+    budget.record({}, rate_limited=True)
+    assert 0 < budget.wait_time() <= _RATE_LIMIT_BACKOFF
+    with pytest.raises(FacebookRequestError) as refused:
+        budget.acquire()
+    assert refused.value.api_error_code() == _THROTTLED_CODE
+    # A header that can't be read leaves the budget alone
+    budget = AccountBudget()
+    budget.record({BUC: "not json"})
+    budget.acquire()
+
+
+def test_throttled_call_is_not_sent(sdk, fake_graph):
+    budget = AccountBudget()
+    budget.record({}, rate_limited=True)
+    with mock.patch.object(meta_sdk, "_account_budget", budget):
+        result = sdk.pause_adset("12340")
+    assert fake_graph.batch_sizes == [], "No Graph call should go out during a back-off"
+    assert result["code"] == _THROTTLED_CODE, f"pause returned {result}"
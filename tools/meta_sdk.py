@@ -3,25 +3,585 @@ Meta Ads SDK - Simple wrapper for Facebook Business SDK
 Direct access to Meta Ads API without complexity
 """
 import os
+import time
+import asyncio
+import threading
+import hashlib
+import inspect
 import logging
-from typing import Dict, Any, List, Optional
+import functools
+import itertools
+import operator
+import re
+import warnings
+from collections import OrderedDict
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Literal, Iterator, Iterable, Mapping
 from datetime import datetime, timedelta
-from facebook_business.api import FacebookAdsApi
+from facebook_business.api import FacebookAdsApi, FacebookResponse
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.campaign import Campaign
 from facebook_business.adobjects.adset import AdSet
 from facebook_business.adobjects.ad import Ad
 from facebook_business.adobjects.adsinsights import AdsInsights
 from facebook_business.exceptions import FacebookRequestError
+from requests.adapters import HTTPAdapter
+import orjson
+import aiohttp
+
+try:
+    import hyperscan
+except ImportError:  # optional, multi-term searches fall back to a Python loop
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+_stdlib_response_json = FacebookResponse.json
+
+
+def _orjson_response_json(self):
+    """Returns the response body -- in json if possible (parsed with orjson)"""
+    try:
+        return orjson.loads(self._body)
+    except (TypeError, ValueError):
+        # orjson rejects a few inputs json accepts (e.g. NaN and Infinity)
+        return _stdlib_response_json(self)
+
+
+# Every Graph response, including cursor pagination and batch bodies, goes
+# through FacebookResponse.json(), so this swaps the parser SDK-wide
+FacebookResponse.json = _orjson_response_json
+
+Detail = Literal['minimal', 'standard', 'full']
+
+# Field tiers per entity. 'standard' is the default; heavy fields such as
+# targeting and the per-action breakdowns (actions, action_values,
+# cost_per_action_type roughly double insights payloads) need detail='full'.
+_CAMPAIGN_FIELDS = {
+    'minimal': ('id', 'name', 'status'),
+    'standard': (
+        'id', 'name', 'status', 'objective',
+        'daily_budget', 'lifetime_budget', 'spend_cap'
+    ),
+    'full': (
+        'id', 'name', 'status', 'objective',
+        'daily_budget', 'lifetime_budget', 'spend_cap',
+        'effective_status', 'budget_remaining', 'start_time', 'stop_time'
+    ),
+}
+_ADSET_FIELDS = {
+    'minimal': ('id', 'name', 'status'),
+    'standard': (
+        'id', 'name', 'status', 'campaign_id',
+        'daily_budget', 'lifetime_budget'
+    ),
+    'full': (
+        'id', 'name', 'status', 'campaign_id',
+        'daily_budget', 'lifetime_budget', 'effective_status', 'targeting'
+    ),
+}
+_AD_FIELDS = {
+    'minimal': ('id', 'name', 'status'),
+    'standard': ('id', 'name', 'status', 'adset_id', 'creative'),
+    'full': ('id', 'name', 'status', 'adset_id', 'creative', 'effective_status'),
+}
+_INSIGHT_METRICS = {
+    'minimal': ('spend', 'impressions', 'clicks'),
+    'standard': (
+        'spend', 'impressions', 'clicks',
+        'ctr', 'cpc', 'cpm', 'conversions', 'purchase_roas'
+    ),
+    'full': (
+        'spend', 'impressions', 'clicks',
+        'ctr', 'cpc', 'cpm', 'conversions', 'purchase_roas',
+        'actions', 'action_values', 'cost_per_action_type'
+    ),
+}
+
+
+_AUDIENCE_FIELDS = ('id', 'name', 'description', 'approximate_count')
+_CREATIVE_FIELDS = ('id', 'name', 'title', 'body')
+
+# The SDK's field check doesn't know Graph field expansion
+# (insights.date_preset(...){...}) and warns on every new call site
+warnings.filterwarnings("ignore", message=r".* does not allow field insights\.", category=UserWarning)
+
+
+def _fields_for(tiers: Dict[str, tuple], detail: str) -> tuple:
+    """Field tuple for a detail tier (the SDK accepts any iterable)"""
+    if detail not in tiers:
+        raise ValueError(f"Unknown detail level: {detail} (use minimal, standard or full)")
+    return tiers[detail]
+
+
+@functools.lru_cache(maxsize=None)
+def _insight_fields(level: Optional[str], detail: str) -> tuple:
+    """Insights fields for a level, led by its name field (none for account)"""
+    metrics = _fields_for(_INSIGHT_METRICS, detail)
+    return (f'{level}_name',) + metrics if level else metrics
+
+
+# Read cache TTLs (seconds) by date_preset: today's numbers move fast,
+# all-time ("maximum") totals barely change. Reads without a date_preset use the default.
+_READ_TTLS = {
+    "today": 15,
+    "yesterday": 300,
+    "last_7d": 300,
+    "last_30d": 300,
+    "maximum": 3600,
+}
+_DEFAULT_READ_TTL = 60
+
+# Insights params for the common date ranges, built once and read-only
+# (the SDK copies params into each request): (date_preset, level) -> params
+_DATE_PARAMS = {
+    (preset, level): MappingProxyType(
+        {'date_preset': preset, 'level': level} if level else {'date_preset': preset}
+    )
+    for preset in ('today', 'yesterday', 'last_7d', 'last_30d', 'maximum')
+    for level in (None, 'account')
+}
+
+
+def _date_params(date_preset: str, level: str = None) -> Mapping:
+    """Insights params for a date_preset (and optional level)"""
+    params = _DATE_PARAMS.get((date_preset, level))
+    if params is None:
+        params = {'date_preset': date_preset, 'level': level} if level else {'date_preset': date_preset}
+    return params
+
+
+# Graph API accepts at most 50 requests per batch call
+_BATCH_LIMIT = 50
+
+# Rows per page for edge listings; the SDK default of 25 means 20x the round
+# trips. Cursors copy their params, so the shared dict is never mutated.
+_PAGE_SIZE = 500
+_PAGE_PARAMS = {'limit': _PAGE_SIZE}
+
+# Concurrent insights fan-out straight against the Graph API
+_GRAPH_HOST = "https://graph.facebook.com"
+_BULK_CONCURRENCY = 8
+# Per request, from sending it to reading the body
+_BULK_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=10)
+
+# Keep-alive pool for the SDK's requests.Session. Together with the aiohttp
+# fan-out above, at most _HTTP_POOL_SIZE + _BULK_CONCURRENCY connections to
+# graph.facebook.com are open at once.
+_HTTP_POOL_SIZE = 32
+_USAGE_THROTTLE_PCT = 70
+
+# Rate-limit error codes (app, user, page, custom, ads management 80000-80014)
+_RATE_LIMIT_CODES = frozenset({4, 17, 32, 613, *range(80000, 80015)})
+_RATE_LIMIT_BACKOFF = 60
+# "Invalid parameter": the only error a search falls back to a local scan for
+_INVALID_PARAM_CODE = 100
+# Reported for calls refused while a back-off is running ("too many calls to
+# this ad account"). SDK calls run on the Discord bot's event loop, so they
+# fail fast rather than sleep the back-off out.
+_THROTTLED_CODE = 80004
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from sync code
+    
+    Uses asyncio.run directly, or a worker thread when called from inside a
+    running event loop (the agent and Discord bot both run in one).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    outcome = {}
+    
+    def runner():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def configure_http_session(api: FacebookAdsApi) -> None:
+    """Give the SDK's requests.Session a pooled keep-alive adapter
+    
+    Idempotent: an adapter already configured this way is kept, so its open
+    connections survive repeated MetaAdsSDK construction.
+    
+    No transport-level retries: urllib3 logs each retried URL, and the SDK
+    puts access_token in the query string. 429/5xx surface as the usual
+    FacebookRequestError, which also records the rate-limit back-off.
+    """
+    session = api._session.requests
+    current = session.adapters.get("https://")
+    if getattr(current, "_pool_maxsize", None) == _HTTP_POOL_SIZE:
+        return
+    
+    session.mount("https://", HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE
+    ))
+    session.headers["Connection"] = "keep-alive"
+
+
+def _api_error(action: str, e: FacebookRequestError) -> Dict:
+    """Log a Graph API error and turn it into the SDK's error dict
+    
+    str(e) renders the whole request and response; callers only need Meta's
+    message and code, so logging is lazy and carries just those.
+    """
+    message = e.api_error_message() or e.get_message()
+    logger.error("Facebook API error %s: %s", action, message)
+    return {"error": f"Facebook API error: {message}", "code": e.api_error_code()}
+
+
+def _header_json(headers, name: str) -> Dict:
+    """Parse a JSON-valued response header, or {} if missing or malformed"""
+    value = headers.get(name) if headers else None
+    if not value:
+        return {}
+    try:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _usage_pct(value) -> float:
+    """A numeric usage figure from a header, or 0 if missing or malformed"""
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+
+def _throttle_delay(headers) -> float:
+    """Seconds to back off, from Meta's usage headers on a response
+    
+    Reads x-business-use-case-usage (per-account call count, CPU and time)
+    and x-fb-ads-insights-throttle (insights utilisation). Returns 0 while
+    every figure stays under _USAGE_THROTTLE_PCT.
+    """
+    delay = 0
+    for entries in _header_json(headers, 'x-business-use-case-usage').values():
+        # Each account maps to a list of usage dicts; skip anything else
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            peak = max(
+                _usage_pct(entry.get("call_count")),
+                _usage_pct(entry.get("total_cputime")),
+                _usage_pct(entry.get("total_time"))
+            )
+            if peak > _USAGE_THROTTLE_PCT:
+                regain_minutes = _usage_pct(entry.get("estimated_time_to_regain_access"))
+                # One second per point over the threshold, unless Meta says longer
+                delay = max(delay, regain_minutes * 60, peak - _USAGE_THROTTLE_PCT)
+    
+    insights = _header_json(headers, 'x-fb-ads-insights-throttle')
+    peak = max(_usage_pct(insights.get('app_id_util_pct')), _usage_pct(insights.get('acc_id_util_pct')))
+    if peak > _USAGE_THROTTLE_PCT:
+        delay = max(delay, peak - _USAGE_THROTTLE_PCT)
+    return delay
+
+
+def _throttled_message(wait: float) -> str:
+    """Error message for a call refused during a back-off"""
+    return f"Meta rate limit reached, retry in {wait:.0f}s"
+
+
+@dataclass
+class AccountBudget:
+    """Process-wide rate-limit headroom, fed by Meta's usage headers
+    
+    Every Graph call records the headers it got back; later calls are
+    refused until any back-off those asked for has passed. The bot serves a single ad account, and
+    adset/campaign calls don't carry the account id, so one budget is shared.
+    """
+    resume_at: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
+    def record(self, headers, rate_limited: bool = False) -> None:
+        """Update the back-off from a response's headers
+        
+        Never raises: a header Meta changed shape on must not turn a
+        successful call into a failure.
+        """
+        try:
+            delay = _throttle_delay(headers)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable usage headers: {e}")
+            delay = 0
+        if rate_limited:
+            delay = max(delay, _RATE_LIMIT_BACKOFF)
+        if not delay:
+            return
+        with self._lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + delay)
+        logger.warning(f"Meta usage near its rate limit, pausing calls for {delay:.0f}s")
+    
+    def wait_time(self) -> float:
+        """Seconds left on the current back-off (0 when calls may go out)"""
+        return max(0.0, self.resume_at - time.monotonic())
+    
+    def acquire(self) -> None:
+        """Raise a rate-limit FacebookRequestError while the back-off lasts
+        
+        Callers already turn that into their usual error dict; sending the
+        call anyway would spend quota while Meta is throttling.
+        """
+        wait = self.wait_time()
+        if wait:
+            raise FacebookRequestError(
+                "Call was not sent",
+                {},
+                429,
+                {},
+                orjson.dumps({"error": {"message": _throttled_message(wait), "code": _THROTTLED_CODE}}).decode()
+            )
+
+
+_account_budget = AccountBudget()
+_original_api_call = FacebookAdsApi.call
+
+
+def _budgeted_api_call(self, *args, **kwargs):
+    """FacebookAdsApi.call that respects and records Meta's usage headers"""
+    _account_budget.acquire()
+    try:
+        response = _original_api_call(self, *args, **kwargs)
+    except FacebookRequestError as e:
+        _account_budget.record(
+            e.http_headers(),
+            rate_limited=e.api_error_code() in _RATE_LIMIT_CODES
+        )
+        raise
+    _account_budget.record(response.headers())
+    return response
+
+
+# Every SDK request (node reads, cursor pages, batches) goes through call()
+FacebookAdsApi.call = _budgeted_api_call
+
+
+def _ttl_for(date_preset: Optional[str]) -> float:
+    """TTL for a cached read with the given date_preset"""
+    return _READ_TTLS.get(date_preset, _DEFAULT_READ_TTL)
+
+
+class _MemoryCache:
+    """In-process LRU with per-entry expiry, shared by all SDK instances"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+
+class _RedisCache:
+    """Redis-backed cache so several bot processes share reads"""
+    
+    def __init__(self, redis_url: str):
+        import redis  # optional dependency, only needed for this backend
+        self._client = redis.Redis.from_url(redis_url)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+    
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(key, value, px=int(ttl * 1000))
+    
+    def clear_prefix(self, prefix: str) -> None:
+        keys = list(self._client.scan_iter(match=f"{prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+_memory_cache = _MemoryCache()
+
+
+def _make_cache(backend: str, redis_url: Optional[str]):
+    """Build the read cache for a backend name ('memory', 'redis' or 'none')"""
+    if backend == "none":
+        return None
+    if backend == "redis":
+        if not redis_url:
+            logger.warning("Redis cache requested without a URL, using memory cache")
+            return _memory_cache
+        try:
+            return _RedisCache(redis_url)
+        except ImportError:
+            logger.warning("redis package not installed, using memory cache")
+            return _memory_cache
+    return _memory_cache
+
+
+def _has_error(result) -> bool:
+    """True for an error dict, or a list with any per-item error row
+    
+    Per-id failures in bulk results are often transient (rate limits), so
+    they must not be cached for the full TTL.
+    """
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list):
+        return any(isinstance(row, dict) and "error" in row for row in result)
+    return False
+
+
+def _cached_read(func):
+    """Cache a read method's error-free results, keyed on its arguments
+    
+    TTL follows the call's date_preset (the default TTL when with_insights is
+    off). Results round-trip through orjson, so every caller gets its own copy
+    to annotate. A cache that errors (Redis down, unserializable result) is
+    logged and skipped: the read goes to Graph instead.
+    """
+    sig = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None:
+            return func(self, *args, **kwargs)
+        
+        bound = sig.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        call_args = dict(list(bound.arguments.items())[1:])
+        digest = hashlib.sha1(
+            orjson.dumps(call_args, option=orjson.OPT_SORT_KEYS, default=str)
+        ).hexdigest()
+        key = f"{self._cache_prefix}{func.__name__}:{digest}"
+        
+        try:
+            cached = cache.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"Read cache unavailable for {func.__name__}, fetching uncached: {e}")
+            return func(self, *args, **kwargs)
+        
+        result = func(self, *args, **kwargs)
+        if not _has_error(result):
+            # The date range only matters when the read includes insights
+            date_preset = call_args.get("date_preset") if call_args.get("with_insights", True) else None
+            try:
+                cache.set(
+                    key,
+                    orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS),
+                    _ttl_for(date_preset)
+                )
+            except Exception as e:
+                logger.warning(f"Could not cache {func.__name__}: {e}")
+        return result
+    
+    return wrapper
+
+
+@functools.lru_cache(maxsize=2048)
+def _adset(adset_id: str) -> AdSet:
+    """Reusable AdSet wrapper for an id
+    
+    Safe to share because every request passes its fields/params fresh.
+    """
+    return AdSet(adset_id)
+
+
+@functools.lru_cache(maxsize=2048)
+def _campaign(campaign_id: str) -> Campaign:
+    """Reusable Campaign wrapper for an id"""
+    return Campaign(campaign_id)
+
+
+# "Miami OR Tampa | Orlando" -> ('miami', 'tampa', 'orlando')
+_TERM_SEPARATORS = re.compile(r'\s+OR\s+|\s*\|\s*')
+# Below this many terms, Python `in` checks beat a Hyperscan scan
+_HYPERSCAN_MIN_TERMS = 4
+
+
+def _split_terms(search_term: str) -> tuple:
+    """Casefolded, de-duplicated OR terms of a search query"""
+    terms = (t.strip().casefold() for t in _TERM_SEPARATORS.split(search_term))
+    return tuple(dict.fromkeys(t for t in terms if t)) or (search_term.casefold(),)
+
+
+@functools.lru_cache(maxsize=128)
+def _term_database(terms: tuple) -> "hyperscan.Database":
+    """Compiled Hyperscan database matching any of the terms as a literal"""
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[re.escape(t).encode() for t in terms],
+        ids=list(range(len(terms))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(terms)
+    )
+    return database
+
+
+def _scan_any(database: "hyperscan.Database", text: str) -> bool:
+    """True if any term in the database occurs in the text"""
+    hits = []
+    database.scan(text.encode(), match_event_handler=lambda *match: hits.append(match[0]))
+    return bool(hits)
+
+
+# Casefolded search text per listing, so local searches don't redo
+# str.lower() on every name: (cache prefix, kind, detail) -> (expires_at, [(text, row), ...])
+_search_indexes: Dict[tuple, tuple] = {}
+
+
+# Shared pieces of the adset/campaign write methods
+_NODE_FACTORIES = {"adset": _adset, "campaign": _campaign}
+_MISSING_ID = {
+    "adset": "Please provide adset_id or id",
+    "campaign": "Please provide campaign_id or id",
+}
+_MISSING_BUDGET = "Please provide daily_budget or lifetime_budget"
+# status -> (log verb, message verb)
+_STATUS_VERBS = {"PAUSED": ("Paused", "paused"), "ACTIVE": ("Resumed", "activated")}
+
 
 class MetaAdsSDK:
     """Simple Meta Ads SDK wrapper"""
     
-    def __init__(self):
-        """Initialize the SDK with credentials from environment"""
+    API_VERSION = "v21.0"
+    
+    # One SDK per process, but every method reads these
+    __slots__ = ('access_token', 'ad_account_id', 'account', '_cache', '_cache_prefix')
+    
+    def __init__(self, cache_backend: str = None, redis_url: str = None):
+        """Initialize the SDK with credentials from environment
+        
+        Args:
+            cache_backend: Read cache - 'memory' (default), 'redis' or 'none'
+            redis_url: Redis connection URL for the 'redis' backend
+        """
         self.access_token = os.getenv("META_ACCESS_TOKEN")
         self.ad_account_id = os.getenv("META_AD_ACCOUNT_ID")
         
@@ -34,80 +594,144 @@ class MetaAdsSDK:
         if not self.ad_account_id.startswith("act_"):
             self.ad_account_id = f"act_{self.ad_account_id}"
         
-        # Initialize Facebook SDK
-        FacebookAdsApi.init(
-            access_token=self.access_token,
-            api_version="v21.0"
-        )
+        # Initialize Facebook SDK, reusing an existing default API (and its
+        # pooled HTTP session) when it was set up with the same credentials
+        api = FacebookAdsApi.get_default_api()
+        if (
+            api is None
+            or api._session.access_token != self.access_token
+            or api._api_version != self.API_VERSION
+        ):
+            FacebookAdsApi.init(
+                access_token=self.access_token,
+                api_version=self.API_VERSION
+            )
+            # Cached wrappers are bound to the previous default API
+            _adset.cache_clear()
+            _campaign.cache_clear()
+        configure_http_session(FacebookAdsApi.get_default_api())
         
         # Get account object
         self.account = AdAccount(self.ad_account_id)
+        
+        # Read cache, cleared for this account whenever we write
+        self._cache = _make_cache(
+            cache_backend or os.getenv("META_CACHE_BACKEND", "memory"),
+            redis_url or os.getenv("REDIS_URL")
+        )
+        self._cache_prefix = f"meta:{self.ad_account_id}:"
         logger.info(f"Meta SDK initialized for account: {self.ad_account_id}")
     
-    def get_all_campaigns(self, fields: List[str] = None) -> List[Dict]:
-        """Get all campaigns in the account"""
+    @staticmethod
+    def _iter_cursor(cursor, limit: int = None) -> Iterator[Dict]:
+        """Yield exported rows from an SDK cursor, at most limit of them
+        
+        Cursors fetch pages lazily, so stopping early skips the remaining pages.
+        """
+        for obj in itertools.islice(cursor, limit):
+            yield obj.export_all_data()
+    
+    def _iter_campaigns(self, fields: List[str], params: Dict = None, limit: int = None) -> Iterator[Dict]:
+        """Stream account campaigns page by page"""
+        params = dict(params or {})
+        # No point fetching pages bigger than what we will keep
+        params.setdefault('limit', min(limit, _PAGE_SIZE) if limit else _PAGE_SIZE)
+        return self._iter_cursor(self.account.get_campaigns(fields=fields, params=params), limit)
+    
+    def _iter_adsets(self, fields: List[str], params: Dict = None, limit: int = None) -> Iterator[Dict]:
+        """Stream account adsets page by page"""
+        params = dict(params or {})
+        params.setdefault('limit', min(limit, _PAGE_SIZE) if limit else _PAGE_SIZE)
+        cursor = self.account.get_ad_sets(fields=fields, params=params)
+        return map(self._add_budget_dollars, self._iter_cursor(cursor, limit))
+    
+    @staticmethod
+    def _add_budget_dollars(adset: Dict) -> Dict:
+        """Add float daily/lifetime_budget_dollars next to Meta's cent strings"""
+        for budget in ('daily_budget', 'lifetime_budget'):
+            if budget in adset:
+                cents = adset[budget]
+                adset[f'{budget}_dollars'] = int(cents) / 100 if cents else 0.0
+        return adset
+    
+    @_cached_read
+    def get_all_campaigns(
+        self,
+        fields: List[str] = None,
+        detail: Detail = 'standard',
+        limit: int = None
+    ) -> List[Dict]:
+        """Get all campaigns in the account (or the first limit of them)"""
         try:
-            if not fields:
-                fields = [
-                    'id', 'name', 'status', 'objective',
-                    'daily_budget', 'lifetime_budget', 'spend_cap'
-                ]
+            fields = fields or _fields_for(_CAMPAIGN_FIELDS, detail)
             
-            campaigns = self.account.get_campaigns(fields=fields)
-            return [campaign.export_all_data() for campaign in campaigns]
+            return list(self._iter_campaigns(fields, limit=limit))
         except FacebookRequestError as e:
-            logger.error(f"Facebook API error: {e}")
-            return {"error": str(e)}
+            return _api_error("getting campaigns", e)
         except Exception as e:
             logger.error(f"Error getting campaigns: {e}")
             return {"error": str(e)}
     
-    def get_campaigns_by_status(self, status: List[str] = None, statuses: List[str] = None) -> List[Dict]:
+    @_cached_read
+    def get_campaigns_by_status(
+        self,
+        status: List[str] = None,
+        statuses: List[str] = None,
+        detail: Detail = 'standard',
+        limit: int = None
+    ) -> List[Dict]:
         """Get campaigns filtered by status"""
+        # Handle both 'status' and 'statuses' parameter names
+        status_list = status or statuses or []
+        
+        # If a single string was passed, convert to list
+        if isinstance(status_list, str):
+            status_list = [status_list]
+        if not status_list:
+            return []
+        
         try:
-            # Handle both 'status' and 'statuses' parameter names
-            status_list = status or statuses or []
-            
-            # If a single string was passed, convert to list
-            if isinstance(status_list, str):
-                status_list = [status_list]
-            
-            campaigns = self.get_all_campaigns()
-            if isinstance(campaigns, dict) and "error" in campaigns:
-                return campaigns
-            
-            return [c for c in campaigns if c.get('status') in status_list]
+            # Let Meta filter server-side so only matching rows come back
+            return list(self._iter_campaigns(
+                _fields_for(_CAMPAIGN_FIELDS, detail),
+                params={'filtering': [{
+                    'field': 'effective_status',
+                    'operator': 'IN',
+                    'value': list(status_list)
+                }]},
+                limit=limit
+            ))
+        except FacebookRequestError as e:
+            return _api_error("filtering campaigns", e)
         except Exception as e:
             logger.error(f"Error filtering campaigns: {e}")
             return {"error": str(e)}
     
+    @_cached_read
     def get_campaign_insights(
         self, 
         campaign_id: str = None,
         id: str = None,
         date_preset: str = "today",
-        fields: List[str] = None
+        fields: List[str] = None,
+        detail: Detail = 'standard'
     ) -> Dict:
         """Get insights for a specific campaign
         
         Note: Meta API returns monetary values in DOLLARS as strings.
         """
+        # Accept both 'campaign_id' and 'id' parameters
+        actual_campaign_id = campaign_id or id
+        if not actual_campaign_id:
+            return {"error": "Please provide a campaign_id or id"}
+        
         try:
-            # Accept both 'campaign_id' and 'id' parameters
-            actual_campaign_id = campaign_id or id
-            if not actual_campaign_id:
-                return {"error": "Please provide a campaign_id or id"}
-                
-            if not fields:
-                fields = [
-                    'campaign_name', 'impressions', 'clicks', 'spend',
-                    'ctr', 'cpc', 'cpm', 'conversions', 'purchase_roas'
-                ]
+            fields = fields or _insight_fields('campaign', detail)
             
-            campaign = Campaign(actual_campaign_id)
+            campaign = _campaign(actual_campaign_id)
             insights = campaign.get_insights(
                 fields=fields,
-                params={'date_preset': date_preset}
+                params=_date_params(date_preset)
             )
             
             if insights:
@@ -119,243 +743,535 @@ class MetaAdsSDK:
             return {"message": "No insights data available"}
             
         except FacebookRequestError as e:
-            logger.error(f"Facebook API error: {e}")
-            return {"error": str(e)}
+            return _api_error("getting insights", e)
         except Exception as e:
             logger.error(f"Error getting insights: {e}")
             return {"error": str(e)}
     
-    def get_performance_metrics(self, date_preset: str = "today") -> Dict:
+    # Only ids are needed to count; the summary's total_count covers accounts
+    # with more active campaigns than fit on one page
+    _ACTIVE_COUNT_PARAMS = {
+        'filtering': [{'field': 'effective_status', 'operator': 'IN', 'value': ['ACTIVE']}],
+        'summary': True,
+        'limit': 500,
+    }
+    
+    @staticmethod
+    def _edge_count(body: Dict) -> int:
+        """Row count of an edge response, preferring Meta's summary total"""
+        summary = body.get('summary') or {}
+        return summary.get('total_count', len(body.get('data', [])))
+    
+    def _insights_with_active_count(self, fields: tuple, params: Mapping) -> tuple:
+        """Account insights rows and the active campaign count in one batch call"""
+        bodies = {}
+        errors = []
+        
+        def on_success(name):
+            def callback(response):
+                bodies[name] = response.json()
+            return callback
+        
+        def on_failure(response):
+            errors.append(response.error())
+        
+        batch = FacebookAdsApi.get_default_api().new_batch()
+        self.account.get_insights(
+            fields=fields, params=params,
+            batch=batch, success=on_success('insights'), failure=on_failure
+        )
+        self.account.get_campaigns(
+            fields=['id'], params=self._ACTIVE_COUNT_PARAMS,
+            batch=batch, success=on_success('campaigns'), failure=on_failure
+        )
+        batch.execute()
+        if errors:
+            raise errors[0]
+        # A null sub-response fires neither callback
+        missing = [name for name in ('insights', 'campaigns') if bodies.get(name) is None]
+        if missing:
+            raise RuntimeError(f"No response from Facebook for {' and '.join(missing)}")
+        
+        return bodies['insights'].get('data', []), self._edge_count(bodies['campaigns'])
+    
+    @_cached_read
+    def get_performance_metrics(
+        self,
+        date_preset: str = "today",
+        detail: Detail = 'standard'
+    ) -> Dict:
         """Get overall account performance metrics"""
         try:
-            fields = [
-                'spend', 'impressions', 'clicks', 'conversions',
-                'ctr', 'cpc', 'cpm', 'purchase_roas'
-            ]
-            
-            insights = self.account.get_insights(
-                fields=fields,
-                params={'date_preset': date_preset, 'level': 'account'}
+            insights, active_campaigns = self._insights_with_active_count(
+                _insight_fields(None, detail),
+                _date_params(date_preset, 'account')
             )
             
             if insights:
-                data = insights[0].export_all_data()
-                # Get campaign breakdown
-                campaigns = self.get_campaigns_by_status(['ACTIVE'])
-                
                 return {
-                    "account_metrics": data,
-                    "active_campaigns": len(campaigns) if isinstance(campaigns, list) else 0,
+                    "account_metrics": insights[0],
+                    "active_campaigns": active_campaigns,
                     "date_range": date_preset
                 }
             return {"message": "No performance data available"}
             
+        except FacebookRequestError as e:
+            return _api_error("getting performance", e)
         except Exception as e:
             logger.error(f"Error getting performance: {e}")
             return {"error": str(e)}
     
-    def search_campaigns(self, query: str = None, name: str = None) -> List[Dict]:
+    @staticmethod
+    def _search_filtering(search_term: str) -> List[Dict]:
+        """Server-side filter for a search term
+        
+        Long numeric terms are Meta object ids; anything else matches names.
+        """
+        if search_term.isdigit() and len(search_term) >= 10:
+            return [{'field': 'id', 'operator': 'EQUAL', 'value': search_term}]
+        return [{'field': 'name', 'operator': 'CONTAIN', 'value': search_term}]
+    
+    def _search_index(self, kind: str, detail: Detail):
+        """(casefolded "name\\nid", row) pairs for every campaign or adset
+        
+        Built from the cached full listing and kept for _DEFAULT_READ_TTL or
+        until the next write. Returns the listing's error dict on failure.
+        """
+        key = (self._cache_prefix, kind, detail)
+        now = time.monotonic()
+        cached = _search_indexes.get(key)
+        if cached and cached[0] > now and self._cache is not None:
+            return cached[1]
+        
+        rows = self.get_all_campaigns(detail=detail) if kind == 'campaign' else self._get_all_adsets(detail=detail)
+        if isinstance(rows, dict):
+            return rows
+        index = [(f"{r.get('name', '')}\n{r.get('id', '')}".casefold(), r) for r in rows]
+        if self._cache is not None:
+            _search_indexes[key] = (now + _DEFAULT_READ_TTL, index)
+        return index
+    
+    @staticmethod
+    def _match_locally(index: Iterable[tuple], terms: tuple) -> Iterator[Dict]:
+        """Client-side substring match of any term on name or id, consumed lazily
+        
+        Yields copies so callers can't alter the shared index rows.
+        """
+        if hyperscan is not None and len(terms) >= _HYPERSCAN_MIN_TERMS:
+            database = _term_database(terms)
+            return (dict(row) for text, row in index if _scan_any(database, text))
+        return (dict(row) for text, row in index if any(t in text for t in terms))
+    
+    @_cached_read
+    def search_campaigns(
+        self,
+        query: str = None,
+        name: str = None,
+        detail: Detail = 'standard',
+        limit: int = None
+    ) -> List[Dict]:
         """Search campaigns by name or query
         
         Args:
             query: Search query (for backward compatibility)
             name: Campaign name to search for (alternative parameter name)
+            limit: Stop after this many matches
         """
+        # Accept both 'query' and 'name' parameters
+        search_term = query or name
+        if not search_term:
+            return {"error": "Please provide a search query or name"}
+        
         try:
-            # Accept both 'query' and 'name' parameters
-            search_term = query or name
-            if not search_term:
-                return {"error": "Please provide a search query or name"}
-                
-            campaigns = self.get_all_campaigns()
-            if isinstance(campaigns, dict) and "error" in campaigns:
-                return campaigns
+            fields = _fields_for(_CAMPAIGN_FIELDS, detail)
+            terms = _split_terms(search_term)
+            # The filtering param has no OR, so multi-term queries scan locally
+            if len(terms) == 1:
+                try:
+                    return list(self._iter_campaigns(
+                        fields,
+                        params={'filtering': self._search_filtering(search_term)},
+                        limit=limit
+                    ))
+                except FacebookRequestError as e:
+                    # Only a rejected filter is worth a full listing; rate limits
+                    # and auth errors would just fail again, at greater cost
+                    if e.api_error_code() != _INVALID_PARAM_CODE:
+                        raise
+                    logger.warning(f"Server-side campaign search rejected, scanning locally: {e.api_error_message()}")
             
-            search_lower = search_term.lower()
-            return [
-                c for c in campaigns 
-                if search_lower in c.get('name', '').lower() or 
-                   search_lower in c.get('id', '').lower()
-            ]
+            index = self._search_index('campaign', detail)
+            if isinstance(index, dict):
+                return index
+            matches = self._match_locally(index, terms)
+            return list(itertools.islice(matches, limit))
+        except FacebookRequestError as e:
+            return _api_error("searching campaigns", e)
         except Exception as e:
             logger.error(f"Error searching campaigns: {e}")
             return {"error": str(e)}
     
-    def search_adsets(self, query: str = None, name: str = None, city: str = None) -> List[Dict]:
+    @_cached_read
+    def search_adsets(
+        self,
+        query: str = None,
+        name: str = None,
+        city: str = None,
+        detail: Detail = 'standard',
+        limit: int = None
+    ) -> List[Dict]:
         """Search adsets by name, query, or city
         
         Args:
             query: Search query
             name: Adset name to search for
             city: City name (since adsets often represent cities in campaigns)
+            limit: Stop after this many matches
         """
+        # Accept multiple parameter names
+        search_term = query or name or city
+        if not search_term:
+            return {"error": "Please provide a search query, name, or city"}
+        
         try:
-            # Accept multiple parameter names
-            search_term = query or name or city
-            if not search_term:
-                return {"error": "Please provide a search query, name, or city"}
-                
-            adsets = self._get_all_adsets()
-            if isinstance(adsets, dict) and "error" in adsets:
-                return adsets
+            fields = _fields_for(_ADSET_FIELDS, detail)
+            terms = _split_terms(search_term)
+            # The filtering param has no OR, so multi-term queries scan locally
+            if len(terms) == 1:
+                try:
+                    return list(self._iter_adsets(
+                        fields,
+                        params={'filtering': self._search_filtering(search_term)},
+                        limit=limit
+                    ))
+                except FacebookRequestError as e:
+                    # Only a rejected filter is worth a full listing; rate limits
+                    # and auth errors would just fail again, at greater cost
+                    if e.api_error_code() != _INVALID_PARAM_CODE:
+                        raise
+                    logger.warning(f"Server-side adset search rejected, scanning locally: {e.api_error_message()}")
             
-            search_lower = search_term.lower()
-            return [
-                a for a in adsets 
-                if search_lower in a.get('name', '').lower() or 
-                   search_lower in a.get('id', '').lower()
-            ]
+            index = self._search_index('adset', detail)
+            if isinstance(index, dict):
+                return index
+            matches = self._match_locally(index, terms)
+            return list(itertools.islice(matches, limit))
+        except FacebookRequestError as e:
+            return _api_error("searching adsets", e)
         except Exception as e:
             logger.error(f"Error searching adsets: {e}")
             return {"error": str(e)}
     
-    def get_adsets_for_campaign(self, campaign_id: str) -> List[Dict]:
-        """Get all ad sets for a campaign"""
+    def _search_all(self, query: str = None, name: str = None) -> List[Dict]:
+        """Search campaigns and adsets in one call (query('search'))
+        
+        Returns one flat list, campaigns first, each row tagged with its
+        "type"; a search that failed contributes a single error row. Runs the
+        two searches one after the other: the read cache and search index are
+        not thread-safe, and with them warm both are memory-only.
+        """
+        search_term = query or name
+        if not search_term:
+            return {"error": "Please provide a search query or name"}
+        
+        hits = []
+        for kind, search in (("campaign", self.search_campaigns), ("adset", self.search_adsets)):
+            rows = search(search_term)
+            if isinstance(rows, dict):
+                hits.append({"type": kind, **rows})
+            else:
+                hits.extend({"type": kind, **row} for row in rows)
+        return hits
+    
+    @_cached_read
+    def get_adsets_for_campaign(
+        self,
+        campaign_id: str,
+        detail: Detail = 'standard',
+        with_insights: bool = False,
+        date_preset: str = "last_7d",
+        fields: List[str] = None
+    ) -> List[Dict]:
+        """Get all ad sets for a campaign (detail='full' adds targeting)
+        
+        Args:
+            campaign_id: The campaign identifier
+            detail: minimal, standard or full
+            with_insights: Also return each adset's insights under 'insights',
+                in the same request (saves one call per adset)
+            date_preset: Date range for with_insights
+            fields: Adset fields to retrieve (overrides detail)
+        """
         try:
-            campaign = Campaign(campaign_id)
-            adsets = campaign.get_ad_sets(fields=[
-                'id', 'name', 'status', 'daily_budget', 
-                'lifetime_budget', 'targeting'
-            ])
-            return [adset.export_all_data() for adset in adsets]
+            fields = tuple(fields) if fields else _fields_for(_ADSET_FIELDS, detail)
+            if with_insights:
+                metrics = ','.join(_fields_for(_INSIGHT_METRICS, detail))
+                fields = fields + (f'insights.date_preset({date_preset}){{{metrics}}}',)
+            
+            campaign = _campaign(campaign_id)
+            adsets = [
+                self._add_budget_dollars(adset.export_all_data())
+                for adset in campaign.get_ad_sets(fields=fields, params=_PAGE_PARAMS)
+            ]
+            if with_insights:
+                for adset in adsets:
+                    rows = (adset.get('insights') or {}).get('data') or []
+                    adset['insights'] = (
+                        self._add_insight_metrics(rows[0]) if rows
+                        else {"message": f"No insights data available for {date_preset}"}
+                    )
+            return adsets
+        except FacebookRequestError as e:
+            return _api_error("getting ad sets", e)
         except Exception as e:
             logger.error(f"Error getting ad sets: {e}")
             return {"error": str(e)}
     
-    def get_ads_for_adset(self, adset_id: str) -> List[Dict]:
+    @_cached_read
+    def get_ads_for_adset(self, adset_id: str, detail: Detail = 'standard') -> List[Dict]:
         """Get all ads for an ad set"""
         try:
-            adset = AdSet(adset_id)
-            ads = adset.get_ads(fields=[
-                'id', 'name', 'status', 'creative'
-            ])
+            adset = _adset(adset_id)
+            ads = adset.get_ads(fields=_fields_for(_AD_FIELDS, detail), params=_PAGE_PARAMS)
             return [ad.export_all_data() for ad in ads]
+        except FacebookRequestError as e:
+            return _api_error("getting ads", e)
         except Exception as e:
             logger.error(f"Error getting ads: {e}")
             return {"error": str(e)}
     
+    @_cached_read
     def get_adset_insights(
         self,
         adset_id: str = None,
         id: str = None,
         date_preset: str = "last_7d",
-        fields: List[str] = None
+        fields: List[str] = None,
+        detail: Detail = 'standard'
     ) -> Dict:
         """Get insights for a specific adset (city)
         
         Args:
             adset_id/id: The adset identifier
-            date_preset: Date range (today, yesterday, last_7d, last_30d, lifetime)
-            fields: Metrics to retrieve
+            date_preset: Date range (today, yesterday, last_7d, last_30d, maximum)
+            fields: Metrics to retrieve (overrides detail)
+            detail: minimal, standard or full (adds per-action breakdowns)
         """
+        actual_adset_id = adset_id or id
+        if not actual_adset_id:
+            return {"error": "Please provide adset_id or id"}
+        
         try:
-            actual_adset_id = adset_id or id
-            if not actual_adset_id:
-                return {"error": "Please provide adset_id or id"}
+            fields = fields or _insight_fields('adset', detail)
             
-            if not fields:
-                fields = [
-                    'adset_name', 'impressions', 'clicks', 'spend',
-                    'ctr', 'cpc', 'cpm', 'conversions', 'purchase_roas',
-                    'actions', 'action_values', 'cost_per_action_type'
-                ]
-            
-            adset = AdSet(actual_adset_id)
+            adset = _adset(actual_adset_id)
             insights = adset.get_insights(
                 fields=fields,
-                params={'date_preset': date_preset}
+                params=_date_params(date_preset)
             )
             
             if insights:
-                data = insights[0].export_all_data()
-                # Extract ROAS if available
-                if 'purchase_roas' in data and data['purchase_roas']:
-                    # purchase_roas is an array with value
-                    if isinstance(data['purchase_roas'], list) and len(data['purchase_roas']) > 0:
-                        data['roas'] = float(data['purchase_roas'][0].get('value', 0))
-                # Meta API returns spend in dollars as a string
-                if 'spend' in data:
-                    data['spend_dollars'] = float(data['spend']) if data['spend'] else 0
-                return data
+                return self._add_insight_metrics(insights[0].export_all_data())
             return {"message": f"No insights data available for {date_preset}"}
             
         except FacebookRequestError as e:
-            logger.error(f"Facebook API error: {e}")
-            return {"error": str(e)}
+            return _api_error("getting adset insights", e)
         except Exception as e:
             logger.error(f"Error getting adset insights: {e}")
             return {"error": str(e)}
     
-    def _get_all_adsets(self) -> List[Dict]:
-        """Get all ad sets from the account"""
+    @staticmethod
+    def _add_insight_metrics(data: Dict) -> Dict:
+        """Add numeric roas and spend_dollars to an insights row"""
+        # Extract ROAS if available
+        if 'purchase_roas' in data and data['purchase_roas']:
+            # purchase_roas is an array with value
+            if isinstance(data['purchase_roas'], list) and len(data['purchase_roas']) > 0:
+                data['roas'] = float(data['purchase_roas'][0].get('value', 0))
+        # Meta API returns spend in dollars as a string
+        if 'spend' in data:
+            data['spend_dollars'] = float(data['spend']) if data['spend'] else 0
+        return data
+    
+    async def _aget(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        object_id: str,
+        fields: List[str],
+        params: Mapping
+    ) -> Dict:
+        """Fetch one object's insights over HTTP, refused during a rate-limit back-off
+        
+        Never raises: a failed request comes back as that id's error row.
+        """
+        async with semaphore:
+            wait = _account_budget.wait_time()
+            if wait:
+                return {"id": object_id, "error": _throttled_message(wait), "code": _THROTTLED_CODE}
+            try:
+                async with session.get(
+                    f"{_GRAPH_HOST}/{self.API_VERSION}/{object_id}/insights",
+                    params={**params, 'fields': ','.join(fields)},
+                    headers={'Authorization': f'Bearer {self.access_token}'}
+                ) as response:
+                    headers = response.headers
+                    body = await response.json(loads=orjson.loads, content_type=None)
+            except Exception as e:
+                # Connection errors, timeouts, and non-JSON bodies (e.g. a 502 page)
+                logger.error(f"Error getting insights for {object_id}: {e!r}")
+                return {"id": object_id, "error": str(e) or type(e).__name__}
+        
+        if not isinstance(body, dict):
+            _account_budget.record(headers)
+            return {"id": object_id, "error": "Unexpected response from Facebook"}
+        error = body.get('error')
+        code = error.get('code') if isinstance(error, dict) else None
+        _account_budget.record(headers, rate_limited=code in _RATE_LIMIT_CODES)
+        if error is not None:
+            message = error.get('message') if isinstance(error, dict) else None
+            return {"id": object_id, "error": message or str(error)}
+        
+        rows = body.get('data') or []
+        if not rows:
+            return {"id": object_id, "message": "No insights data available"}
+        return {"id": object_id, **self._add_insight_metrics(rows[0])}
+    
+    async def _get_insights_bulk_async(
+        self,
+        ids: List[str],
+        fields: List[str],
+        params: Mapping
+    ) -> List[Dict]:
+        """Fetch insights for many objects concurrently"""
+        semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=_BULK_CONCURRENCY)
+        async with aiohttp.ClientSession(connector=connector, timeout=_BULK_TIMEOUT) as session:
+            return await asyncio.gather(*(
+                self._aget(session, semaphore, object_id, fields, params)
+                for object_id in ids
+            ))
+    
+    @_cached_read
+    def get_insights_bulk(
+        self,
+        ids: List[str],
+        level: str = "adset",
+        date_preset: str = "last_7d",
+        fields: List[str] = None,
+        detail: Detail = 'standard'
+    ) -> List[Dict]:
+        """Get insights for many campaigns/adsets/ads at once
+        
+        Args:
+            ids: Object ids, all of the same level
+            level: campaign, adset or ad (picks the name field)
+            date_preset: Date range (today, yesterday, last_7d, last_30d, maximum)
+            fields: Metrics to retrieve (overrides detail)
+            detail: minimal, standard or full (adds per-action breakdowns)
+        """
+        if not ids:
+            return {"error": "Please provide a list of ids"}
+        if isinstance(ids, str):
+            ids = [ids]
+        
+        try:
+            fields = fields or _insight_fields(level, detail)
+            
+            return _run_sync(self._get_insights_bulk_async(
+                list(ids), fields, _date_params(date_preset)
+            ))
+        except Exception as e:
+            logger.error(f"Error getting bulk insights: {e}")
+            return {"error": str(e)}
+    
+    @_cached_read
+    def _get_all_adsets(self, detail: Detail = 'standard', limit: int = None) -> List[Dict]:
+        """Get all ad sets from the account (or the first limit of them)"""
         try:
-            adsets = self.account.get_ad_sets(fields=[
-                'id', 'name', 'status', 'campaign_id', 'daily_budget'
-            ])
-            return [adset.export_all_data() for adset in adsets]
+            return list(self._iter_adsets(_fields_for(_ADSET_FIELDS, detail), limit=limit))
+        except FacebookRequestError as e:
+            return _api_error("getting all adsets", e)
         except Exception as e:
             logger.error(f"Error getting all adsets: {e}")
             return {"error": str(e)}
     
-    def _get_all_ads(self) -> List[Dict]:
+    @_cached_read
+    def _get_all_ads(self, detail: Detail = 'standard') -> List[Dict]:
         """Get all ads from the account"""
         try:
-            ads = self.account.get_ads(fields=[
-                'id', 'name', 'status', 'adset_id', 'creative'
-            ])
+            ads = self.account.get_ads(fields=_fields_for(_AD_FIELDS, detail), params=_PAGE_PARAMS)
             return [ad.export_all_data() for ad in ads]
+        except FacebookRequestError as e:
+            return _api_error("getting all ads", e)
         except Exception as e:
             logger.error(f"Error getting all ads: {e}")
             return {"error": str(e)}
     
+    @_cached_read
     def _get_audiences(self) -> List[Dict]:
         """Get custom audiences"""
         try:
-            audiences = self.account.get_custom_audiences(fields=[
-                'id', 'name', 'description', 'approximate_count'
-            ])
+            audiences = self.account.get_custom_audiences(fields=_AUDIENCE_FIELDS, params=_PAGE_PARAMS)
             return [audience.export_all_data() for audience in audiences]
+        except FacebookRequestError as e:
+            return _api_error("getting audiences", e)
         except Exception as e:
             logger.error(f"Error getting audiences: {e}")
             return {"error": str(e)}
     
+    @_cached_read
     def _get_creatives(self) -> List[Dict]:
         """Get ad creatives"""
         try:
-            creatives = self.account.get_ad_creatives(fields=[
-                'id', 'name', 'title', 'body'
-            ])
+            creatives = self.account.get_ad_creatives(fields=_CREATIVE_FIELDS, params=_PAGE_PARAMS)
             return [creative.export_all_data() for creative in creatives]
+        except FacebookRequestError as e:
+            return _api_error("getting creatives", e)
         except Exception as e:
             logger.error(f"Error getting creatives: {e}")
             return {"error": str(e)}
     
+    # query() dispatch, built once at class creation (subclasses can extend
+    # it). Fixed-argument ops are methodcallers applied to the SDK; the rest
+    # are (method name, ((param, default), ...)) and take their arguments
+    # from the caller's params.
+    _OPS = {
+        "campaigns": operator.methodcaller("get_all_campaigns"),
+        "active_campaigns": operator.methodcaller("get_campaigns_by_status", ("ACTIVE",)),
+        "campaign_insights": ("get_campaign_insights", (("campaign_id", None), ("date_preset", "today"))),
+        "performance": ("get_performance_metrics", (("date_preset", "today"),)),
+        "adsets": operator.methodcaller("_get_all_adsets"),
+        "ads": operator.methodcaller("_get_all_ads"),
+        "audiences": operator.methodcaller("_get_audiences"),
+        "creatives": operator.methodcaller("_get_creatives"),
+        "search": ("_search_all", (("query", None), ("name", None))),
+    }
+    # Ops narrowed to one parent when params carry its id: op -> (param, method name)
+    _SCOPED_OPS = {
+        "adsets": ("campaign_id", "get_adsets_for_campaign"),
+        "ads": ("adset_id", "get_ads_for_adset"),
+    }
+    
     def query(self, operation: str, params: Dict = None) -> Any:
         """Generic query method for flexibility"""
+        params = params or {}
         try:
-            # Map operations to methods
-            operations = {
-                "campaigns": self.get_all_campaigns,
-                "active_campaigns": lambda: self.get_campaigns_by_status(['ACTIVE']),
-                "campaign_insights": lambda: self.get_campaign_insights(
-                    params.get('campaign_id'),
-                    params.get('date_preset', 'today')
-                ),
-                "performance": lambda: self.get_performance_metrics(
-                    params.get('date_preset', 'today')
-                ),
-                "adsets": lambda: self._get_all_adsets() if not params or 'campaign_id' not in params else self.get_adsets_for_campaign(params.get('campaign_id')),
-                "ads": lambda: self._get_all_ads() if not params or 'adset_id' not in params else self.get_ads_for_adset(params.get('adset_id')),
-                "audiences": lambda: self._get_audiences(),
-                "creatives": lambda: self._get_creatives(),
-                "search": lambda: self.search_campaigns(params.get('query', '') if params else '')
-            }
-            
-            if operation in operations:
-                return operations[operation]()
-            else:
+            op = self._OPS.get(operation)
+            if op is None:
                 return {"error": f"Unknown operation: {operation}"}
+            
+            scope = self._SCOPED_OPS.get(operation)
+            if scope and scope[0] in params:
+                return getattr(self, scope[1])(params[scope[0]])
+            if callable(op):
+                return op(self)
+            
+            method, spec = op
+            return getattr(self, method)(**{name: params.get(name, default) for name, default in spec})
                 
+        except FacebookRequestError as e:
+            return _api_error("in query", e)
         except Exception as e:
             logger.error(f"Query error: {e}")
             return {"error": str(e)}
@@ -363,201 +1279,257 @@ class MetaAdsSDK:
     # ============= UPDATE METHODS =============
     # These methods allow modifying campaigns and adsets
     
-    def update_adset_budget(
-        self,
-        adset_id: str = None,
-        id: str = None,
+    def _invalidate_cache(self) -> None:
+        """Drop cached reads for this account after a write"""
+        if self._cache is not None:
+            try:
+                self._cache.clear_prefix(self._cache_prefix)
+            except Exception as e:
+                logger.error(f"Could not clear the read cache after a write: {e}")
+        for key in [k for k in _search_indexes if k[0] == self._cache_prefix]:
+            _search_indexes.pop(key, None)
+    
+    @staticmethod
+    def _budget_params(
         daily_budget: float = None,
         lifetime_budget: float = None,
         budget: float = None
     ) -> Dict:
-        """Update adset budget (values in dollars, converts to cents)
+        """Build budget update params, converting dollars to cents"""
+        params = {}
+        if daily_budget is not None:
+            params['daily_budget'] = int(daily_budget * 100)
+        elif budget is not None:
+            params['daily_budget'] = int(budget * 100)
         
-        Args:
-            adset_id/id: The adset identifier
-            daily_budget/budget: Daily budget in dollars
-            lifetime_budget: Lifetime budget in dollars
-            
-        Note: Meta API expects budget values in CENTS for updates,
-        but returns them in DOLLARS for reads.
+        if lifetime_budget is not None:
+            params['lifetime_budget'] = int(lifetime_budget * 100)
+        return params
+    
+    def _run_batch(self, ops: List[tuple]) -> List[Dict]:
+        """Run (node, params) updates through Graph batch requests
+        
+        Sends up to _BATCH_LIMIT updates per HTTP call. Returns one entry per
+        op, in order: the response body, or {"error": ...} if that update (or
+        the call carrying its chunk) failed.
         """
+        results: List[Optional[Dict]] = [None] * len(ops)
+        
+        def on_success(index):
+            def callback(response):
+                results[index] = response.json()
+            return callback
+        
+        def on_failure(index):
+            def callback(response):
+                error = response.error()
+                results[index] = {
+                    "error": f"Facebook API error: {error.api_error_message() or error.get_message()}",
+                    "code": error.api_error_code()
+                }
+            return callback
+        
+        api = FacebookAdsApi.get_default_api()
         try:
-            actual_id = adset_id or id
+            for start in range(0, len(ops), _BATCH_LIMIT):
+                chunk = range(start, min(start + _BATCH_LIMIT, len(ops)))
+                try:
+                    batch = api.new_batch()
+                    for index in chunk:
+                        node, params = ops[index]
+                        node.api_update(
+                            params=params,
+                            batch=batch,
+                            success=on_success(index),
+                            failure=on_failure(index)
+                        )
+                    batch.execute()
+                except FacebookRequestError as e:
+                    # The whole chunk failed; earlier chunks' results stand
+                    error = _api_error("in batch update", e)
+                    for index in chunk:
+                        if results[index] is None:
+                            results[index] = dict(error)
+                except Exception as e:
+                    logger.error(f"Error in batch update: {e}")
+                    for index in chunk:
+                        if results[index] is None:
+                            results[index] = {"error": str(e)}
+        finally:
+            # Earlier chunks may have landed even if a later one raised
+            self._invalidate_cache()
+        return [
+            result if result is not None else {"error": "No response from Facebook for this update"}
+            for result in results
+        ]
+    
+    def bulk_update_adsets(self, updates: List[Dict]) -> Dict:
+        """Update many adsets in batched API calls
+        
+        Args:
+            updates: One dict per adset with adset_id/id plus any of
+                daily_budget/budget, lifetime_budget (dollars) and status
+        """
+        if not updates:
+            return {"error": "Please provide at least one adset update"}
+        
+        ops = []
+        for update in updates:
+            actual_id = update.get('adset_id') or update.get('id')
             if not actual_id:
-                return {"error": "Please provide adset_id or id"}
-            
-            # Prepare update params
-            params = {}
-            
-            # Convert dollars to cents (Meta API uses cents)
-            if daily_budget is not None:
-                params['daily_budget'] = int(daily_budget * 100)
-            elif budget is not None:
-                params['daily_budget'] = int(budget * 100)
-            
-            if lifetime_budget is not None:
-                params['lifetime_budget'] = int(lifetime_budget * 100)
-            
+                return {"error": f"Missing adset_id or id in update: {update}"}
+            params = self._budget_params(
+                update.get('daily_budget'),
+                update.get('lifetime_budget'),
+                update.get('budget')
+            )
+            if update.get('status'):
+                params['status'] = update['status']
             if not params:
-                return {"error": "Please provide daily_budget or lifetime_budget"}
-            
-            # Update the adset
-            adset = AdSet(actual_id)
-            response = adset.api_update(params=params)
+                return {"error": f"Nothing to update for adset {actual_id}"}
+            ops.append((_adset(actual_id), params))
+        
+        try:
+            results = self._run_batch(ops)
+            updated, failed = [], []
+            for (node, params), result in zip(ops, results):
+                if "error" in result:
+                    failed.append({"adset_id": node['id'], "error": result["error"]})
+                else:
+                    updated.append({"adset_id": node['id'], "updated_fields": params})
             
-            logger.info(f"Updated adset {actual_id} budget: {params}")
+            logger.info(f"Bulk updated {len(updated)} of {len(ops)} adsets")
+            if not updated:
+                return {"error": "All adset updates failed", "failed": failed}
             return {
                 "success": True,
-                "adset_id": actual_id,
-                "updated_fields": params,
-                "message": f"Successfully updated budget for adset {actual_id}"
+                "updated": updated,
+                "failed": failed,
+                "message": f"Successfully updated {len(updated)} of {len(ops)} adsets"
             }
             
         except FacebookRequestError as e:
-            logger.error(f"Facebook API error updating adset: {e}")
-            return {"error": f"Facebook API error: {e.api_error_message()}"}
+            return _api_error("in bulk adset update", e)
         except Exception as e:
-            logger.error(f"Error updating adset: {e}")
+            logger.error(f"Error in bulk adset update: {e}")
             return {"error": str(e)}
     
-    def update_campaign_budget(
+    def bulk_pause_adsets(self, adset_ids: List[str]) -> Dict:
+        """Pause many adsets in batched API calls"""
+        return self.bulk_update_adsets(
+            [{"adset_id": adset_id, "status": "PAUSED"} for adset_id in adset_ids or []]
+        )
+    
+    def _set_budget(
         self,
-        campaign_id: str = None,
-        id: str = None,
+        kind: str,
+        actual_id: str,
         daily_budget: float = None,
         lifetime_budget: float = None,
         budget: float = None
     ) -> Dict:
-        """Update campaign budget (values in dollars, converts to cents)
+        """Update an adset/campaign budget (dollars in, cents to Meta)"""
+        if not actual_id:
+            return {"error": _MISSING_ID[kind]}
+        params = self._budget_params(daily_budget, lifetime_budget, budget)
+        if not params:
+            return {"error": _MISSING_BUDGET}
         
-        Args:
-            campaign_id/id: The campaign identifier
-            daily_budget/budget: Daily budget in dollars
-            lifetime_budget: Lifetime budget in dollars
-        """
         try:
-            actual_id = campaign_id or id
-            if not actual_id:
-                return {"error": "Please provide campaign_id or id"}
+            result = self._run_batch([(_NODE_FACTORIES[kind](actual_id), params)])[0]
+            if "error" in result:
+                logger.error(f"Facebook API error updating {kind}: {result['error']}")
+                return result
             
-            # Prepare update params
-            params = {}
-            
-            # Convert dollars to cents
-            if daily_budget is not None:
-                params['daily_budget'] = int(daily_budget * 100)
-            elif budget is not None:
-                params['daily_budget'] = int(budget * 100)
-            
-            if lifetime_budget is not None:
-                params['lifetime_budget'] = int(lifetime_budget * 100)
-            
-            if not params:
-                return {"error": "Please provide daily_budget or lifetime_budget"}
-            
-            # Update the campaign
-            campaign = Campaign(actual_id)
-            response = campaign.api_update(params=params)
-            
-            logger.info(f"Updated campaign {actual_id} budget: {params}")
+            logger.info(f"Updated {kind} {actual_id} budget: {params}")
             return {
                 "success": True,
-                "campaign_id": actual_id,
+                f"{kind}_id": actual_id,
                 "updated_fields": params,
-                "message": f"Successfully updated budget for campaign {actual_id}"
+                "message": f"Successfully updated budget for {kind} {actual_id}"
             }
             
         except FacebookRequestError as e:
-            logger.error(f"Facebook API error updating campaign: {e}")
-            return {"error": f"Facebook API error: {e.api_error_message()}"}
+            return _api_error(f"updating {kind}", e)
         except Exception as e:
-            logger.error(f"Error updating campaign: {e}")
+            logger.error(f"Error updating {kind}: {e}")
             return {"error": str(e)}
     
-    def pause_adset(self, adset_id: str = None, id: str = None) -> Dict:
-        """Pause an adset"""
+    def _set_status(self, kind: str, actual_id: str, status: str) -> Dict:
+        """Pause (PAUSED) or activate (ACTIVE) an adset/campaign"""
+        if not actual_id:
+            return {"error": _MISSING_ID[kind]}
+        logged, done = _STATUS_VERBS[status]
+        
         try:
-            actual_id = adset_id or id
-            if not actual_id:
-                return {"error": "Please provide adset_id or id"}
-            
-            adset = AdSet(actual_id)
-            response = adset.api_update(params={'status': 'PAUSED'})
+            result = self._run_batch([(_NODE_FACTORIES[kind](actual_id), {'status': status})])[0]
+            if "error" in result:
+                logger.error(f"Error setting {kind} status: {result['error']}")
+                return result
             
-            logger.info(f"Paused adset {actual_id}")
+            logger.info(f"{logged} {kind} {actual_id}")
             return {
                 "success": True,
-                "adset_id": actual_id,
-                "status": "PAUSED",
-                "message": f"Successfully paused adset {actual_id}"
+                f"{kind}_id": actual_id,
+                "status": status,
+                "message": f"Successfully {done} {kind} {actual_id}"
             }
             
+        except FacebookRequestError as e:
+            return _api_error(f"setting {kind} status", e)
         except Exception as e:
-            logger.error(f"Error pausing adset: {e}")
+            logger.error(f"Error setting {kind} status: {e}")
             return {"error": str(e)}
     
+    def update_adset_budget(
+        self,
+        adset_id: str = None,
+        id: str = None,
+        daily_budget: float = None,
+        lifetime_budget: float = None,
+        budget: float = None
+    ) -> Dict:
+        """Update adset budget (values in dollars, converts to cents)
+        
+        Args:
+            adset_id/id: The adset identifier
+            daily_budget/budget: Daily budget in dollars
+            lifetime_budget: Lifetime budget in dollars
+            
+        Note: Meta API expects budget values in CENTS for updates,
+        but returns them in DOLLARS for reads.
+        """
+        return self._set_budget("adset", adset_id or id, daily_budget, lifetime_budget, budget)
+    
+    def update_campaign_budget(
+        self,
+        campaign_id: str = None,
+        id: str = None,
+        daily_budget: float = None,
+        lifetime_budget: float = None,
+        budget: float = None
+    ) -> Dict:
+        """Update campaign budget (values in dollars, converts to cents)
+        
+        Args:
+            campaign_id/id: The campaign identifier
+            daily_budget/budget: Daily budget in dollars
+            lifetime_budget: Lifetime budget in dollars
+        """
+        return self._set_budget("campaign", campaign_id or id, daily_budget, lifetime_budget, budget)
+    
+    def pause_adset(self, adset_id: str = None, id: str = None) -> Dict:
+        """Pause an adset"""
+        return self._set_status("adset", adset_id or id, "PAUSED")
+    
     def resume_adset(self, adset_id: str = None, id: str = None) -> Dict:
         """Resume/activate an adset"""
-        try:
-            actual_id = adset_id or id
-            if not actual_id:
-                return {"error": "Please provide adset_id or id"}
-            
-            adset = AdSet(actual_id)
-            response = adset.api_update(params={'status': 'ACTIVE'})
-            
-            logger.info(f"Resumed adset {actual_id}")
-            return {
-                "success": True,
-                "adset_id": actual_id,
-                "status": "ACTIVE",
-                "message": f"Successfully activated adset {actual_id}"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error resuming adset: {e}")
-            return {"error": str(e)}
+        return self._set_status("adset", adset_id or id, "ACTIVE")
     
     def pause_campaign(self, campaign_id: str = None, id: str = None) -> Dict:
         """Pause a campaign"""
-        try:
-            actual_id = campaign_id or id
-            if not actual_id:
-                return {"error": "Please provide campaign_id or id"}
-            
-            campaign = Campaign(actual_id)
-            response = campaign.api_update(params={'status': 'PAUSED'})
-            
-            logger.info(f"Paused campaign {actual_id}")
-            return {
-                "success": True,
-                "campaign_id": actual_id,
-                "status": "PAUSED",
-                "message": f"Successfully paused campaign {actual_id}"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error pausing campaign: {e}")
-            return {"error": str(e)}
+        return self._set_status("campaign", campaign_id or id, "PAUSED")
     
     def resume_campaign(self, campaign_id: str = None, id: str = None) -> Dict:
         """Resume/activate a campaign"""
-        try:
-            actual_id = campaign_id or id
-            if not actual_id:
-                return {"error": "Please provide campaign_id or id"}
-            
-            campaign = Campaign(actual_id)
-            response = campaign.api_update(params={'status': 'ACTIVE'})
-            
-            logger.info(f"Resumed campaign {actual_id}")
-            return {
-                "success": True,
-                "campaign_id": actual_id,
-                "status": "ACTIVE",
-                "message": f"Successfully activated campaign {actual_id}"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error resuming campaign: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+        return self._set_status("campaign", campaign_id or id, "ACTIVE")
\ No newline at end of file
@@ -22,16 +22,16 @@ async def trace_execution():
     if campaigns:
         campaign_id = campaigns[0]['id']
         
-        # Step 2: Get adsets
-        adsets = sdk.get_adsets_for_campaign(campaign_id)
+        # Step 2: Get adsets, with their insights expanded in the same request
+        adsets = sdk.get_adsets_for_campaign(campaign_id, with_insights=True, date_preset='maximum')
         print(f'Step 2: Found {len(adsets)} adsets')
         
-        # Step 3: Get insights for each adset
+        # Step 3: Read insights for each adset
         print('\nStep 3: Getting insights for each adset:')
         total = 0
         for adset in adsets:
-            insights = sdk.get_adset_insights(adset['id'], date_preset='maximum')
-            if isinstance(insights, dict) and 'error' not in insights:
+            insights = adset['insights']
+            if 'error' not in insights:
                 spend = insights.get('spend_dollars', 0)
                 roas = insights.get('roas', 0)
                 print(f'  - {adset["name"][:30]:30} : ${spend:7.2f} (ROAS: {roas:.2f})')
@@ -9,6 +9,9 @@ load_dotenv()
 
 from tools.meta_sdk import MetaAdsSDK
 
+# All this script reads from each adset
+BUDGET_FIELDS = ['id', 'name', 'status', 'daily_budget']
+
 def verify_update():
     sdk = MetaAdsSDK()
     
@@ -28,7 +31,7 @@ def verify_update():
     
     # Step 2: Get adsets
     print("\n2. Getting adsets...")
-    adsets = sdk.get_adsets_for_campaign(campaign_id)
+    adsets = sdk.get_adsets_for_campaign(campaign_id, fields=BUDGET_FIELDS)
     
     brooklyn_adset = None
     for adset in adsets:
@@ -42,9 +45,7 @@ def verify_update():
     
     adset_id = brooklyn_adset['id']
     current_budget = brooklyn_adset.get('daily_budget', 0)
-    
-    # Convert cents to dollars for display
-    current_budget_dollars = int(current_budget) / 100 if current_budget else 0
+    current_budget_dollars = brooklyn_adset.get('daily_budget_dollars', 0.0)
     
     print(f"   Brooklyn adset: {brooklyn_adset['name']}")
     print(f"   ID: {adset_id}")
@@ -63,12 +64,12 @@ def verify_update():
     
     # Step 4: Verify the change
     print("\n4. Fetching updated adset to verify...")
-    updated_adsets = sdk.get_adsets_for_campaign(campaign_id)
+    updated_adsets = sdk.get_adsets_for_campaign(campaign_id, fields=BUDGET_FIELDS)
     
     for adset in updated_adsets:
         if adset['id'] == adset_id:
             new_budget = adset.get('daily_budget', 0)
-            new_budget_dollars = int(new_budget) / 100 if new_budget else 0
+            new_budget_dollars = adset.get('daily_budget_dollars', 0.0)
             
             print(f"   New budget: ${new_budget_dollars:.2f} (raw: {new_budget} cents)")
             